@@ -1,6 +1,6 @@
 """Application configuration."""
-import os
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
 from typing import Optional, List
 
@@ -8,6 +8,8 @@ from typing import Optional, List
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
+
     # Application
     APP_NAME: str = "Psychological Assessment Chatbot"
     APP_VERSION: str = "1.0.0"
@@ -15,6 +17,12 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./psychological.db"
+    DB_POOL_SIZE: int = 5                 # Connections kept open (and warmed at startup)
+    DB_MAX_OVERFLOW: int = 10             # Extra connections allowed under burst load
+    DB_POOL_TIMEOUT: int = 30             # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800           # Seconds before a pooled connection is replaced
+    DB_STATEMENT_CACHE_SIZE: int = 200    # asyncpg prepared statements cached per connection
+    DB_STREAM_BATCH_SIZE: int = 100       # Rows fetched per batch by streamed reads
 
     # OpenAI
     OPENAI_API_KEY: Optional[str] = None
@@ -49,9 +57,15 @@ class Settings(BaseSettings):
     DOSE_MAX_ITEMS_PER_TRAIT: int = 4
     NATURAL_MIN_TURNS: int = 10
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    # Result caching (per worker process)
+    AGGREGATE_CACHE_SECONDS: float = 20.0     # Max age of cached aggregate results
+    SESSION_RESULTS_CACHE_SIZE: int = 1024    # Completed sessions' results kept
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing the environment only once."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -1,16 +1,50 @@
 """Async database configuration with SQLAlchemy."""
+import asyncio
+import orjson
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from typing import AsyncGenerator
+from sqlalchemy.sql import Executable
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Sequence
 
 from ..config import settings
 
 
+def _engine_options(url: str) -> Dict[str, Any]:
+    """Dialect-specific engine options."""
+    options: Dict[str, Any] = {}
+    if not url.startswith("sqlite"):
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            # Replace connections dropped by the server (e.g. idle timeouts)
+            pool_pre_ping=True,
+        )
+    if "+asyncpg" in url:
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
+    return options
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson (numpy scalars included)."""
+    return orjson.dumps(
+        value,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    ).decode()
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **_engine_options(settings.DATABASE_URL),
 )
 
 # Create async session factory
@@ -41,12 +75,63 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def stream_partitions(
+    session: AsyncSession,
+    statement: Executable,
+    scalars: bool = False,
+    batch_size: int = None,
+) -> AsyncIterator[Sequence[Any]]:
+    """
+    Stream a large read in fixed-size batches.
+
+    Uses yield_per, so rows come from a server-side cursor (where the
+    driver has one) and at most one batch of ORM objects or Row tuples is
+    held at a time. Relationship loaders in the statement's options run
+    once per batch.
+
+    Args:
+        session: Database session (kept open while iterating)
+        statement: Select statement to stream
+        scalars: Yield the first column of each row instead of Row tuples
+        batch_size: Rows per batch (defaults to DB_STREAM_BATCH_SIZE)
+
+    Yields:
+        Lists of at most batch_size rows or scalars
+    """
+    statement = statement.execution_options(
+        yield_per=batch_size or settings.DB_STREAM_BATCH_SIZE
+    )
+    if scalars:
+        result = await session.stream_scalars(statement)
+    else:
+        result = await session.stream(statement)
+    async for batch in result.partitions():
+        yield batch
+
+
 async def create_tables():
     """Create all database tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warmup_connections(count: int = None):
+    """
+    Open pool connections ahead of the first request.
+
+    Runs SELECT 1 on `count` concurrently checked-out connections so the
+    TCP/TLS/auth handshakes happen at startup; the connections then stay
+    in the pool for reuse.
+    """
+    count = count or settings.DB_POOL_SIZE
+
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(count)))
+
+
 async def drop_tables():
     """Drop all database tables."""
     async with engine.begin() as conn:
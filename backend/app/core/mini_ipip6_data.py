@@ -9,50 +9,56 @@ New Zealand Journal of Psychology, 41(3), 20-30.
 Parameters extracted from Table 2 (page 26).
 """
 
-from typing import Dict, List
+import numpy as np
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Tuple
+
+# Module-level constants are read-only (tuples, frozensets, mapping proxies)
 
 # Six personality traits measured by Mini-IPIP6
-TRAITS = [
+TRAITS = (
     "extraversion",
     "agreeableness",
     "conscientiousness",
     "neuroticism",
     "openness",
     "honesty_humility"
-]
+)
 
 # Trait display names (English)
-TRAIT_NAMES = {
+TRAIT_NAMES: Mapping[str, str] = MappingProxyType({
     "extraversion": "Extraversion",
     "agreeableness": "Agreeableness",
     "conscientiousness": "Conscientiousness",
     "neuroticism": "Neuroticism",
     "openness": "Openness to Experience",
     "honesty_humility": "Honesty-Humility"
-}
+})
 
 # Trait display names (Korean)
-TRAIT_NAMES_KR = {
+TRAIT_NAMES_KR: Mapping[str, str] = MappingProxyType({
     "extraversion": "외향성",
     "agreeableness": "우호성",
     "conscientiousness": "성실성",
     "neuroticism": "신경증",
     "openness": "개방성",
     "honesty_humility": "정직-겸손"
-}
+})
 
 # Items for each trait (1-indexed item numbers)
-TRAIT_ITEMS = {
-    "extraversion": [1, 7, 19, 23],
-    "agreeableness": [2, 8, 14, 20],
-    "conscientiousness": [3, 10, 11, 22],
-    "neuroticism": [4, 15, 16, 17],
-    "openness": [5, 9, 13, 21],
-    "honesty_humility": [6, 12, 18, 24]
-}
+TRAIT_ITEMS: Mapping[str, Tuple[int, ...]] = MappingProxyType({
+    "extraversion": (1, 7, 19, 23),
+    "agreeableness": (2, 8, 14, 20),
+    "conscientiousness": (3, 10, 11, 22),
+    "neuroticism": (4, 15, 16, 17),
+    "openness": (5, 9, 13, 21),
+    "honesty_humility": (6, 12, 18, 24)
+})
 
 # Items that need reverse scoring
-REVERSE_SCORED_ITEMS = [6, 7, 8, 9, 11, 12, 13, 15, 17, 18, 19, 20, 21, 22, 24]
+REVERSE_SCORED_ITEMS: FrozenSet[int] = frozenset(
+    {6, 7, 8, 9, 11, 12, 13, 15, 17, 18, 19, 20, 21, 22, 24}
+)
 
 # Complete Mini-IPIP6 item data with IRT parameters
 # alpha: discrimination parameter
@@ -240,7 +246,7 @@ MINI_IPIP6_ITEMS: Dict[int, Dict] = {
 }
 
 # Korean translations for all items
-MINI_IPIP6_ITEMS_KR: Dict[int, str] = {
+MINI_IPIP6_ITEMS_KR: Mapping[int, str] = MappingProxyType({
     1: "나는 파티의 분위기 메이커이다.",
     2: "나는 다른 사람들의 감정에 공감한다.",
     3: "나는 집안일을 바로바로 처리한다.",
@@ -265,33 +271,75 @@ MINI_IPIP6_ITEMS_KR: Dict[int, str] = {
     22: "나는 물건을 제자리에 돌려놓는 것을 자주 잊어버린다.",
     23: "나는 파티에서 다양한 사람들과 대화한다.",
     24: "나는 비싼 명품을 소유하는 것에서 큰 즐거움을 얻을 것이다.",
+})
+
+
+# Display text keyed by (lang, item_number) and (lang, trait)
+_ITEM_TEXT: Dict[Tuple[str, int], str] = {
+    **{("en", num): item["text"] for num, item in MINI_IPIP6_ITEMS.items()},
+    **{("kr", num): text for num, text in MINI_IPIP6_ITEMS_KR.items()},
+}
+_TRAIT_NAME: Dict[Tuple[str, str], str] = {
+    **{("en", trait): name for trait, name in TRAIT_NAMES.items()},
+    **{("kr", trait): name for trait, name in TRAIT_NAMES_KR.items()},
 }
 
 
 def get_item_text(item_number: int, lang: str = "en") -> str:
     """Get item text by item number and language."""
-    if lang == "kr" and item_number in MINI_IPIP6_ITEMS_KR:
-        return MINI_IPIP6_ITEMS_KR[item_number]
-    return MINI_IPIP6_ITEMS.get(item_number, {}).get("text", "")
+    return _ITEM_TEXT.get((lang, item_number)) or _ITEM_TEXT.get(("en", item_number), "")
 
 
 def get_trait_name(trait: str, lang: str = "en") -> str:
     """Get trait display name by language."""
-    if lang == "kr":
-        return TRAIT_NAMES_KR.get(trait, trait)
-    return TRAIT_NAMES.get(trait, trait)
+    return _TRAIT_NAME.get((lang, trait)) or _TRAIT_NAME.get(("en", trait), trait)
 
 
 # Survey presentation order (1-24)
-SURVEY_ORDER = list(range(1, 25))
+SURVEY_ORDER = tuple(range(1, 25))
+
+# (item_number, text, trait) per survey position, in SURVEY_ORDER order
+SURVEY_ORDER_ITEMS: Tuple[Tuple[int, str, str], ...] = tuple(
+    (n, MINI_IPIP6_ITEMS[n]["text"], MINI_IPIP6_ITEMS[n]["trait"])
+    for n in SURVEY_ORDER
+)
 
 # Item numbers sorted by presentation in the original questionnaire
-ITEM_PRESENTATION_ORDER = [
+ITEM_PRESENTATION_ORDER = (
     1, 2, 3, 4, 5, 6,      # Items 1-6
     7, 8, 9, 10, 11, 12,   # Items 7-12
     13, 14, 15, 16, 17, 18,  # Items 13-18
     19, 20, 21, 22, 23, 24   # Items 19-24
-]
+)
+
+
+# Lookup tables indexed directly by item number (index 0 unused)
+_REVERSE = bytes(1 if i in REVERSE_SCORED_ITEMS else 0 for i in range(25))
+_TRAIT = tuple(MINI_IPIP6_ITEMS.get(i, {}).get("trait", "") for i in range(25))
+_TRAIT_ITEM_DATA: Dict[str, Tuple[Dict, ...]] = {
+    trait: tuple(MINI_IPIP6_ITEMS[n] for n in items)
+    for trait, items in TRAIT_ITEMS.items()
+}
+
+# Trait items ordered by descending discrimination (stable for ties)
+_TRAIT_ITEMS_BY_ALPHA_DESC: Dict[str, Tuple[int, ...]] = {
+    trait: tuple(sorted(items, key=lambda n: -MINI_IPIP6_ITEMS[n]["alpha"]))
+    for trait, items in TRAIT_ITEMS.items()
+}
+
+# IRT parameters as contiguous arrays indexed by item number (row 0 unused)
+# ALPHA: shape (25,), BETA: shape (25, 6), REVERSED: shape (25,) bool
+ALPHA = np.zeros(25, dtype=np.float64)
+BETA = np.zeros((25, 6), dtype=np.float64)
+REVERSED = np.zeros(25, dtype=bool)
+for _num, _item in MINI_IPIP6_ITEMS.items():
+    ALPHA[_num] = _item["alpha"]
+    BETA[_num] = _item["beta"]
+    REVERSED[_num] = _item["reverse_scored"]
+del _num, _item
+ALPHA.flags.writeable = False
+BETA.flags.writeable = False
+REVERSED.flags.writeable = False
 
 
 def get_item(item_number: int) -> Dict:
@@ -299,28 +347,35 @@ def get_item(item_number: int) -> Dict:
     return MINI_IPIP6_ITEMS.get(item_number)
 
 
-def get_trait_items(trait: str) -> List[int]:
+def get_item_params(item_number: int) -> Tuple[float, np.ndarray]:
+    """Get (alpha, betas) for an item; betas is a read-only view into BETA."""
+    return float(ALPHA[item_number]), BETA[item_number]
+
+
+def get_item_trait(item_number: int) -> str:
+    """Get the trait an item belongs to."""
+    return _TRAIT[item_number]
+
+
+def get_trait_items(trait: str) -> Tuple[int, ...]:
     """Get all item numbers for a trait."""
-    return TRAIT_ITEMS.get(trait, [])
+    return TRAIT_ITEMS.get(trait, ())
 
 
-def get_items_for_trait(trait: str) -> List[Dict]:
+def get_items_for_trait(trait: str) -> Tuple[Dict, ...]:
     """Get all item data for a trait."""
-    item_numbers = TRAIT_ITEMS.get(trait, [])
-    return [MINI_IPIP6_ITEMS[n] for n in item_numbers]
+    return _TRAIT_ITEM_DATA.get(trait, ())
 
 
 def get_highest_discrimination_item(trait: str, exclude: List[int] = None) -> int:
     """Get the item with highest discrimination (alpha) for a trait."""
-    exclude = exclude or []
-    items = [
-        (num, MINI_IPIP6_ITEMS[num]["alpha"])
-        for num in TRAIT_ITEMS[trait]
-        if num not in exclude
-    ]
-    if not items:
-        return None
-    return max(items, key=lambda x: x[1])[0]
+    if not exclude:
+        return _TRAIT_ITEMS_BY_ALPHA_DESC[trait][0]
+    exclude_set = frozenset(exclude)
+    for num in _TRAIT_ITEMS_BY_ALPHA_DESC[trait]:
+        if num not in exclude_set:
+            return num
+    return None
 
 
 def reverse_score(response: int) -> int:
@@ -330,6 +385,4 @@ def reverse_score(response: int) -> int:
 
 def score_response(item_number: int, response: int) -> int:
     """Score a response, applying reverse scoring if needed."""
-    if MINI_IPIP6_ITEMS[item_number]["reverse_scored"]:
-        return reverse_score(response)
-    return response
+    return 8 - response if _REVERSE[item_number] else response
@@ -0,0 +1,20 @@
+"""Response classes."""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Defined locally because FastAPI's own ORJSONResponse is deprecated in
+    recent releases. Handles numpy scalars/arrays and non-string dict keys.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
@@ -1,18 +1,21 @@
 """Main FastAPI application."""
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
-from .config import settings
-from .core.database import create_tables
+from .config import Settings, settings, get_settings
+from .core.database import create_tables, warmup_connections
+from .core.responses import ORJSONResponse
 from .routers import participants, survey, dose_chatbot, results, satisfaction, export
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    # Startup: create database tables
+    # Startup: create database tables and open pooled connections
     await create_tables()
+    await warmup_connections()
     yield
     # Shutdown: cleanup if needed
 
@@ -22,8 +25,12 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="Psychological Assessment Chatbot API - Comparing traditional surveys with DOSE adaptive chatbot assessments",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Compress larger payloads (exports, result listings)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -43,11 +50,11 @@ app.include_router(export.router, prefix="/api/export", tags=["Data Export"])
 
 
 @app.get("/")
-async def root():
+async def root(app_settings: Settings = Depends(get_settings)):
     """Root endpoint."""
     return {
-        "name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
+        "name": app_settings.APP_NAME,
+        "version": app_settings.APP_VERSION,
         "status": "running",
         "docs": "/docs",
     }
@@ -1,12 +1,14 @@
 """Database models."""
-from .participant import Participant
+from .participant import Participant, participant_counter
 from .session import AssessmentSession, SessionType, SessionStatus
 from .response import ItemResponse, ChatLog
 from .result import AssessmentResult
 from .satisfaction import SatisfactionSurvey
+from .stats import SessionTypeStats
 
 __all__ = [
     "Participant",
+    "participant_counter",
     "AssessmentSession",
     "SessionType",
     "SessionStatus",
@@ -14,4 +16,5 @@ __all__ = [
     "ChatLog",
     "AssessmentResult",
     "SatisfactionSurvey",
+    "SessionTypeStats",
 ]
@@ -0,0 +1,33 @@
+"""
+Shared column definitions for the ORM models.
+"""
+from sqlalchemy import Column, String, DateTime, func
+from sqlalchemy.orm import mapped_column
+
+from ..utils import new_id
+
+
+class UUIDPkMixin:
+    """String UUID primary key, generated application-side."""
+
+    # sort_order keeps id as the first column in CREATE TABLE
+    id = mapped_column(
+        String(36),
+        primary_key=True,
+        default=new_id,
+        sort_order=-1
+    )
+
+
+class TimestampMixin:
+    """
+    Row creation timestamp, set by the database.
+
+    now() is sent with the INSERT as well as declared as the server default,
+    so tables created before the server default existed still get a value.
+    eager_defaults fetches it with the INSERT (RETURNING), so a new object
+    needs no refresh before its created_at is read.
+    """
+    __mapper_args__ = {"eager_defaults": True}
+
+    created_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now())
@@ -1,18 +1,24 @@
 """Participant database model."""
-import uuid
-from datetime import datetime
-from typing import List, TYPE_CHECKING
-from sqlalchemy import Column, String, Integer, DateTime, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from typing import List, Optional, TYPE_CHECKING
+from sqlalchemy import Column, String, Integer, DateTime, Index, Sequence, func
 from sqlalchemy.orm import relationship, Mapped
 
 from ..core.database import Base
+from ..utils import make_dict_projector
+from ..services.counterbalancing import CONDITION_ORDERS
+from ._mixins import UUIDPkMixin, TimestampMixin
 
 if TYPE_CHECKING:
     from .session import AssessmentSession
+    from .satisfaction import SatisfactionSurvey
 
 
-class Participant(Base):
+# Source of participant numbers (P001, P002, ...) on databases with
+# sequences; created alongside the tables, ignored on SQLite
+participant_counter = Sequence("participant_counter", metadata=Base.metadata)
+
+
+class Participant(UUIDPkMixin, TimestampMixin, Base):
     """
     Participant model for storing user information.
 
@@ -20,11 +26,9 @@ class Participant(Base):
     within-subject counterbalancing.
     """
     __tablename__ = "participants"
-
-    id = Column(
-        String(36),
-        primary_key=True,
-        default=lambda: str(uuid.uuid4())
+    __table_args__ = (
+        # Newest-first pagination in list_participants (scanned backwards)
+        Index("ix_participants_created_at", "created_at"),
     )
 
     # Anonymous participant code (e.g., "P001", "P002")
@@ -35,33 +39,43 @@ class Participant(Base):
     gender = Column(String(20), nullable=True)
     education_level = Column(String(50), nullable=True)
 
-    # Latin Square counterbalancing
+    # Latin Square counterbalancing; condition_order is derived from the row
     latin_square_row = Column(Integer, nullable=False)
-    condition_order = Column(JSON, nullable=False)  # ["survey", "static", "dose", "natural"]
 
-    # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Timestamps (created_at comes from TimestampMixin)
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now()
+    )
 
-    # Relationships
+    # Relationships (lazy="raise": load explicitly, e.g. with selectinload)
     sessions: Mapped[List["AssessmentSession"]] = relationship(
         "AssessmentSession",
         back_populates="participant",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise"
+    )
+    satisfaction_survey: Mapped[Optional["SatisfactionSurvey"]] = relationship(
+        "SatisfactionSurvey",
+        back_populates="participant",
+        uselist=False,
+        cascade="all, delete-orphan",
+        lazy="raise"
+    )
+
+    # Fields projected by the generated to_dict()
+    _DICT_KEYS = (
+        "id", "participant_code", "age", "gender", "education_level",
+        "latin_square_row", "condition_order", "created_at",
     )
+    to_dict = make_dict_projector(_DICT_KEYS, ("created_at",))
+
+    @property
+    def condition_order(self) -> List[str]:
+        """Condition names in the participant's assigned order."""
+        return list(CONDITION_ORDERS[self.latin_square_row])
 
     def __repr__(self):
         return f"<Participant {self.participant_code}>"
-
-    def to_dict(self):
-        """Convert to dictionary."""
-        return {
-            "id": self.id,
-            "participant_code": self.participant_code,
-            "age": self.age,
-            "gender": self.gender,
-            "education_level": self.education_level,
-            "latin_square_row": self.latin_square_row,
-            "condition_order": self.condition_order,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
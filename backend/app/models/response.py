@@ -1,17 +1,17 @@
 """Item response database model."""
-import uuid
-from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Text, Index, func
 from sqlalchemy.orm import relationship, Mapped
 
 from ..core.database import Base
+from ..utils import make_dict_projector
+from ._mixins import UUIDPkMixin
 
 if TYPE_CHECKING:
     from .session import AssessmentSession
 
 
-class ItemResponse(Base):
+class ItemResponse(UUIDPkMixin, Base):
     """
     Item response model.
 
@@ -19,19 +19,16 @@ class ItemResponse(Base):
     for DOSE chatbot sessions.
     """
     __tablename__ = "item_responses"
-
-    id = Column(
-        String(36),
-        primary_key=True,
-        default=lambda: str(uuid.uuid4())
+    __table_args__ = (
+        # Covers session_id lookups and returns responses in presentation order
+        Index("ix_itemresp_session_order", "session_id", "presentation_order"),
     )
 
-    # Foreign key to session
+    # Foreign key to session (indexed via ix_itemresp_session_order)
     session_id = Column(
         String(36),
         ForeignKey("assessment_sessions.id"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Item information
@@ -51,7 +48,7 @@ class ItemResponse(Base):
     presentation_order = Column(Integer, nullable=False)
 
     # Timestamp
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime(timezone=True), default=func.now(), server_default=func.now())
 
     # Relationship
     session: Mapped["AssessmentSession"] = relationship(
@@ -59,29 +56,19 @@ class ItemResponse(Base):
         back_populates="responses"
     )
 
+    # Fields projected by the generated to_dict()
+    _DICT_KEYS = (
+        "id", "session_id", "item_number", "trait", "response_value",
+        "response_time_ms", "theta_before", "theta_after", "se_before",
+        "se_after", "fisher_information", "presentation_order", "timestamp",
+    )
+    to_dict = make_dict_projector(_DICT_KEYS, ("timestamp",))
+
     def __repr__(self):
         return f"<ItemResponse item={self.item_number} value={self.response_value}>"
 
-    def to_dict(self):
-        """Convert to dictionary."""
-        return {
-            "id": self.id,
-            "session_id": self.session_id,
-            "item_number": self.item_number,
-            "trait": self.trait,
-            "response_value": self.response_value,
-            "response_time_ms": self.response_time_ms,
-            "theta_before": self.theta_before,
-            "theta_after": self.theta_after,
-            "se_before": self.se_before,
-            "se_after": self.se_after,
-            "fisher_information": self.fisher_information,
-            "presentation_order": self.presentation_order,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-        }
-
-
-class ChatLog(Base):
+
+class ChatLog(UUIDPkMixin, Base):
     """
     Chat conversation log for Natural chatbot (G4).
 
@@ -89,12 +76,6 @@ class ChatLog(Base):
     """
     __tablename__ = "chat_logs"
 
-    id = Column(
-        String(36),
-        primary_key=True,
-        default=lambda: str(uuid.uuid4())
-    )
-
     # Foreign key to session
     session_id = Column(
         String(36),
@@ -109,18 +90,11 @@ class ChatLog(Base):
     content = Column(Text, nullable=False)
 
     # Timestamp
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime(timezone=True), default=func.now(), server_default=func.now())
+
+    # Fields projected by the generated to_dict()
+    _DICT_KEYS = ("id", "session_id", "turn_number", "role", "content", "timestamp")
+    to_dict = make_dict_projector(_DICT_KEYS, ("timestamp",))
 
     def __repr__(self):
         return f"<ChatLog turn={self.turn_number} role={self.role}>"
-
-    def to_dict(self):
-        """Convert to dictionary."""
-        return {
-            "id": self.id,
-            "session_id": self.session_id,
-            "turn_number": self.turn_number,
-            "role": self.role,
-            "content": self.content,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-        }
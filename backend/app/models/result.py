@@ -1,17 +1,18 @@
 """Assessment result database model."""
-import uuid
-from datetime import datetime
+from operator import attrgetter
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, String, Integer, Float, DateTime, JSON, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, JSON, ForeignKey
 from sqlalchemy.orm import relationship, Mapped
 
 from ..core.database import Base
+from ..core.mini_ipip6_data import TRAITS
+from ._mixins import UUIDPkMixin, TimestampMixin
 
 if TYPE_CHECKING:
     from .session import AssessmentSession
 
 
-class AssessmentResult(Base):
+class AssessmentResult(UUIDPkMixin, TimestampMixin, Base):
     """
     Assessment result model.
 
@@ -19,12 +20,6 @@ class AssessmentResult(Base):
     """
     __tablename__ = "assessment_results"
 
-    id = Column(
-        String(36),
-        primary_key=True,
-        default=lambda: str(uuid.uuid4())
-    )
-
     # Foreign key to session (one-to-one)
     session_id = Column(
         String(36),
@@ -58,15 +53,16 @@ class AssessmentResult(Base):
     total_duration_seconds = Column(Integer, nullable=False)
     item_reduction_rate = Column(Float, nullable=True)  # For DOSE
 
-    # Timestamp
-    created_at = Column(DateTime, default=datetime.utcnow)
-
     # Relationship
     session: Mapped["AssessmentSession"] = relationship(
         "AssessmentSession",
         back_populates="result"
     )
 
+    # Per-trait column getters, in TRAITS order
+    _SCORES_GET = attrgetter(*(f"{trait}_score" for trait in TRAITS))
+    _SES_GET = attrgetter(*(f"{trait}_se" for trait in TRAITS))
+
     def __repr__(self):
         return f"<AssessmentResult session={self.session_id[:8]}>"
 
@@ -75,22 +71,8 @@ class AssessmentResult(Base):
         return {
             "id": self.id,
             "session_id": self.session_id,
-            "scores": {
-                "extraversion": self.extraversion_score,
-                "agreeableness": self.agreeableness_score,
-                "conscientiousness": self.conscientiousness_score,
-                "neuroticism": self.neuroticism_score,
-                "openness": self.openness_score,
-                "honesty_humility": self.honesty_humility_score,
-            },
-            "standard_errors": {
-                "extraversion": self.extraversion_se,
-                "agreeableness": self.agreeableness_se,
-                "conscientiousness": self.conscientiousness_se,
-                "neuroticism": self.neuroticism_se,
-                "openness": self.openness_se,
-                "honesty_humility": self.honesty_humility_se,
-            },
+            "scores": self.get_scores_dict(),
+            "standard_errors": self.get_standard_errors_dict(),
             "llm_reasoning": self.llm_reasoning,
             "metrics": {
                 "total_items": self.total_items_administered,
@@ -103,11 +85,8 @@ class AssessmentResult(Base):
 
     def get_scores_dict(self):
         """Get just the trait scores as a dict."""
-        return {
-            "extraversion": self.extraversion_score,
-            "agreeableness": self.agreeableness_score,
-            "conscientiousness": self.conscientiousness_score,
-            "neuroticism": self.neuroticism_score,
-            "openness": self.openness_score,
-            "honesty_humility": self.honesty_humility_score,
-        }
+        return dict(zip(TRAITS, self._SCORES_GET(self)))
+
+    def get_standard_errors_dict(self):
+        """Get just the trait standard errors as a dict."""
+        return dict(zip(TRAITS, self._SES_GET(self)))
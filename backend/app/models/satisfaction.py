@@ -1,13 +1,13 @@
 """Satisfaction survey database model."""
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, Integer, Text, ForeignKey
 from sqlalchemy.orm import relationship
 
 from ..core.database import Base
+from ..utils import make_dict_projector
+from ._mixins import UUIDPkMixin, TimestampMixin
 
 
-class SatisfactionSurvey(Base):
+class SatisfactionSurvey(UUIDPkMixin, TimestampMixin, Base):
     """
     Satisfaction survey model for storing user feedback after completing assessments.
 
@@ -15,12 +15,6 @@ class SatisfactionSurvey(Base):
     """
     __tablename__ = "satisfaction_surveys"
 
-    id = Column(
-        String(36),
-        primary_key=True,
-        default=lambda: str(uuid.uuid4())
-    )
-
     # Foreign key to participant
     participant_id = Column(
         String(36),
@@ -47,25 +41,16 @@ class SatisfactionSurvey(Base):
     # Language used during survey
     language = Column(String(10), nullable=True, default="en")
 
-    # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-
     # Relationship
-    participant = relationship("Participant", backref="satisfaction_survey")
+    participant = relationship("Participant", back_populates="satisfaction_survey")
+
+    # Fields projected by the generated to_dict()
+    _DICT_KEYS = (
+        "id", "participant_id", "overall_rating", "preferred_method",
+        "dose_ease_of_use", "would_recommend", "open_feedback", "language",
+        "created_at",
+    )
+    to_dict = make_dict_projector(_DICT_KEYS, ("created_at",))
 
     def __repr__(self):
         return f"<SatisfactionSurvey {self.id} for participant {self.participant_id}>"
-
-    def to_dict(self):
-        """Convert to dictionary."""
-        return {
-            "id": self.id,
-            "participant_id": self.participant_id,
-            "overall_rating": self.overall_rating,
-            "preferred_method": self.preferred_method,
-            "dose_ease_of_use": self.dose_ease_of_use,
-            "would_recommend": self.would_recommend,
-            "open_feedback": self.open_feedback,
-            "language": self.language,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
@@ -1,12 +1,18 @@
 """Assessment session database model."""
-import uuid
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
-from sqlalchemy import Column, String, Integer, DateTime, JSON, ForeignKey, Enum
+from sqlalchemy import Column, String, Integer, DateTime, JSON, LargeBinary, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import relationship, Mapped
 import enum
 
+import msgpack
+import orjson
+
 from ..core.database import Base
+from ..utils import make_dict_projector
+from ._mixins import UUIDPkMixin
 
 if TYPE_CHECKING:
     from .participant import Participant
@@ -14,6 +20,10 @@ if TYPE_CHECKING:
     from .result import AssessmentResult
 
 
+# JSONB on PostgreSQL (binary storage, indexable), generic JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
 class SessionType(str, enum.Enum):
     """Types of assessment sessions."""
     SURVEY = "survey"
@@ -27,7 +37,57 @@ class SessionStatus(str, enum.Enum):
     ABANDONED = "abandoned"
 
 
-class AssessmentSession(Base):
+class EnumStr(TypeDecorator):
+    """
+    Python enum stored as a plain VARCHAR of the member name.
+
+    Avoids a server-side enum type (and its per-column adaptation on
+    PostgreSQL) while keeping the same stored values as Enum().
+    """
+    impl = String(16)
+    cache_ok = True
+
+    def __init__(self, enum_class: type[enum.Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_class(value).name
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_class[value]
+
+
+class MsgPackType(TypeDecorator):
+    """
+    JSON-compatible value stored as MessagePack bytes.
+
+    Used for the DOSE state, which is rewritten on every response and
+    never queried server-side. Rows written as JSON text before the
+    switch are still decoded.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return msgpack.packb(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # Legacy JSON text: a MessagePack map never starts with "{"
+        if isinstance(value, str) or value[:1] == b"{":
+            return orjson.loads(value)
+        return msgpack.unpackb(value)
+
+
+class AssessmentSession(UUIDPkMixin, Base):
     """
     Assessment session model.
 
@@ -35,31 +95,30 @@ class AssessmentSession(Base):
     including progress, responses, and results.
     """
     __tablename__ = "assessment_sessions"
-
-    id = Column(
-        String(36),
-        primary_key=True,
-        default=lambda: str(uuid.uuid4())
+    __table_args__ = (
+        # Covers participant_id lookups and the "already completed" checks
+        Index("ix_session_participant_type_status", "participant_id", "session_type", "status"),
+        # Global completed-by-type counts (export summary, aggregate results)
+        Index("ix_session_status_type", "status", "session_type"),
     )
 
-    # Foreign key to participant
+    # Foreign key to participant (indexed via ix_session_participant_type_status)
     participant_id = Column(
         String(36),
         ForeignKey("participants.id"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Session type and order
     session_type = Column(
-        Enum(SessionType),
+        EnumStr(SessionType),
         nullable=False
     )
     sequence_number = Column(Integer, nullable=False)  # 1-4 within participant
 
     # Status
     status = Column(
-        Enum(SessionStatus),
+        EnumStr(SessionStatus),
         default=SessionStatus.IN_PROGRESS
     )
 
@@ -69,16 +128,16 @@ class AssessmentSession(Base):
     duration_seconds = Column(Integer, nullable=True)
 
     # DOSE-specific tracking (stored as JSON)
-    current_theta = Column(JSON, nullable=True)  # {trait: theta_value}
-    current_se = Column(JSON, nullable=True)     # {trait: se_value}
+    current_theta = Column(JSONType, nullable=True)  # {trait: theta_value}
+    current_se = Column(JSONType, nullable=True)     # {trait: se_value}
     items_administered = Column(Integer, default=0)
-    dose_state = Column(JSON, nullable=True)     # Complete DOSE algorithm state for persistence
+    dose_state = Column(MsgPackType, nullable=True)  # Complete DOSE algorithm state for persistence
 
     # Natural chatbot specific
-    conversation_state = Column(JSON, nullable=True)  # Chat history
+    conversation_state = Column(JSONType, nullable=True)  # Chat history
     turn_count = Column(Integer, default=0)
 
-    # Relationships
+    # Relationships (collections lazy="raise": load explicitly, e.g. with selectinload)
     participant: Mapped["Participant"] = relationship(
         "Participant",
         back_populates="sessions"
@@ -86,29 +145,28 @@ class AssessmentSession(Base):
     responses: Mapped[List["ItemResponse"]] = relationship(
         "ItemResponse",
         back_populates="session",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise"
     )
     result: Mapped[Optional["AssessmentResult"]] = relationship(
         "AssessmentResult",
         back_populates="session",
         uselist=False,
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise"
     )
 
     def __repr__(self):
         return f"<AssessmentSession {self.id[:8]} ({self.session_type.value})>"
 
-    def to_dict(self):
-        """Convert to dictionary."""
-        return {
-            "id": self.id,
-            "participant_id": self.participant_id,
-            "session_type": self.session_type.value,
-            "sequence_number": self.sequence_number,
-            "status": self.status.value,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "duration_seconds": self.duration_seconds,
-            "items_administered": self.items_administered,
-            "turn_count": self.turn_count,
-        }
+    # Fields projected by the generated to_dict()
+    _DICT_KEYS = (
+        "id", "participant_id", "session_type", "sequence_number", "status",
+        "started_at", "completed_at", "duration_seconds",
+        "items_administered", "turn_count",
+    )
+    to_dict = make_dict_projector(
+        _DICT_KEYS,
+        datetime_keys=("started_at", "completed_at"),
+        enum_keys=("session_type", "status"),
+    )
@@ -0,0 +1,26 @@
+"""Running session statistics database model."""
+from sqlalchemy import Column, Integer, Float
+
+from ..core.database import Base
+from .session import EnumStr, SessionType
+
+
+class SessionTypeStats(Base):
+    """
+    Running totals over completed sessions, one row per session type.
+
+    Updated in the same transaction that completes a session, so aggregate
+    results are read from this small table instead of scanning every
+    historical session and result.
+    """
+    __tablename__ = "session_type_stats"
+
+    session_type = Column(EnumStr(SessionType), primary_key=True)
+
+    completed_count = Column(Integer, nullable=False, default=0)
+    sum_items_administered = Column(Integer, nullable=False, default=0)
+    sum_duration_seconds = Column(Integer, nullable=False, default=0)
+    sum_item_reduction_rate = Column(Float, nullable=False, default=0.0)  # Missing rates count as 0
+
+    def __repr__(self):
+        return f"<SessionTypeStats {self.session_type.value}: {self.completed_count}>"
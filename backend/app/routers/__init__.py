@@ -1,10 +1,9 @@
-"""API routers."""
-from . import participants
-from . import survey
-from . import static_chatbot
-from . import dose_chatbot
-from . import natural_chatbot
-from . import results
+"""API routers.
+
+Submodules are imported on demand (``from .routers import survey``) so that
+loading one router does not pull in the others, e.g. the unmounted natural
+chatbot router and its LLM service.
+"""
 
 __all__ = [
     "participants",
@@ -13,4 +12,6 @@ __all__ = [
     "dose_chatbot",
     "natural_chatbot",
     "results",
+    "satisfaction",
+    "export",
 ]
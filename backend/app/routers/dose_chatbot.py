@@ -1,34 +1,64 @@
 """G3: DOSE Adaptive Chatbot API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, and_, bindparam
+from sqlalchemy.orm import raiseload
 from datetime import datetime
-import json
 
 from ..core.database import get_db
-from ..core.mini_ipip6_data import MINI_IPIP6_ITEMS, TRAITS
+from ..core.responses import ORJSONResponse
+from ..core.mini_ipip6_data import TRAITS
 from ..models import (
     Participant, AssessmentSession, SessionType, SessionStatus,
     ItemResponse, AssessmentResult
 )
 from ..schemas import (
-    DOSEStartResponse, DOSERespond, DOSERespondResponse,
-    TraitEstimate, DOSEProgress
+    DOSEStartResponse, DOSERespond, DOSERespondResponse
 )
-from ..services.dose_algorithm import DOSEAlgorithm, DOSESessionState, DOSEAction
+from ..services.dose_algorithm import DOSEAlgorithm, DOSESessionState, DOSEAction, dose_algorithm
 from ..services.counterbalancing import get_sequence_number
-from ..services.irt_engine import irt_engine
+from ..services.session_stats import record_session_completion
+from ..utils import new_ids
 
 router = APIRouter()
 
+# Initial per-trait estimates for a new session (copied, never mutated)
+_INITIAL_THETA = dict.fromkeys(TRAITS, 0.0)
+_INITIAL_SE = dict.fromkeys(TRAITS, 1.0)
+
+# Statements built once at import and executed with bound parameters
+_PARTICIPANT_WITH_COMPLETED_DOSE = (
+    select(Participant, AssessmentSession.id)
+    .outerjoin(
+        AssessmentSession,
+        and_(
+            AssessmentSession.participant_id == Participant.id,
+            AssessmentSession.session_type == SessionType.DOSE,
+            AssessmentSession.status == SessionStatus.COMPLETED,
+        )
+    )
+    .where(Participant.id == bindparam("participant_id"))
+    .limit(1)
+)
+_SESSION_BY_ID = (
+    select(AssessmentSession)
+    .options(raiseload("*"))
+    .where(AssessmentSession.id == bindparam("session_id"))
+)
+
 
 def get_dose_algorithm() -> DOSEAlgorithm:
-    """Dependency for DOSE algorithm."""
-    return DOSEAlgorithm()
+    """Dependency for DOSE algorithm (shared, stateless instance)."""
+    return dose_algorithm
 
 
 def save_dose_state(session: AssessmentSession, dose_state: DOSESessionState) -> None:
-    """Save DOSE state to database session."""
+    """
+    Save DOSE state to database session.
+
+    The state lives only in the database row (never in process memory),
+    so any worker can serve the next request for this session.
+    """
     session.dose_state = dose_state.to_dict()
 
 
@@ -39,33 +69,33 @@ def load_dose_state(session: AssessmentSession) -> DOSESessionState:
     return DOSESessionState.from_dict(session.dose_state)
 
 
-@router.post("/{participant_id}/start", response_model=DOSEStartResponse)
+@router.post(
+    "/{participant_id}/start",
+    response_model=None,
+    responses={200: {"model": DOSEStartResponse}},
+)
 async def start_dose_chatbot(
     participant_id: str,
     db: AsyncSession = Depends(get_db),
     dose: DOSEAlgorithm = Depends(get_dose_algorithm)
 ):
     """Start a new DOSE adaptive chatbot session."""
-    # Verify participant exists
+    # Fetch participant and any completed DOSE session in one round trip
     result = await db.execute(
-        select(Participant).where(Participant.id == participant_id)
+        _PARTICIPANT_WITH_COMPLETED_DOSE, {"participant_id": participant_id}
     )
-    participant = result.scalar_one_or_none()
+    row = result.first()
 
-    if not participant:
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Participant not found"
         )
 
+    participant, completed_session_id = row
+
     # Check if DOSE already completed
-    result = await db.execute(
-        select(AssessmentSession)
-        .where(AssessmentSession.participant_id == participant_id)
-        .where(AssessmentSession.session_type == SessionType.DOSE)
-        .where(AssessmentSession.status == SessionStatus.COMPLETED)
-    )
-    if result.scalar_one_or_none():
+    if completed_session_id is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="DOSE chatbot already completed for this participant"
@@ -84,8 +114,8 @@ async def start_dose_chatbot(
         sequence_number=sequence,
         status=SessionStatus.IN_PROGRESS,
         items_administered=0,
-        current_theta={trait: 0.0 for trait in TRAITS},
-        current_se={trait: 1.0 for trait in TRAITS},
+        current_theta=_INITIAL_THETA.copy(),
+        current_se=_INITIAL_SE.copy(),
     )
 
     # Get first action (which item to present)
@@ -96,32 +126,25 @@ async def start_dose_chatbot(
 
     db.add(session)
     await db.commit()
-    await db.refresh(session)
-
-    # Build response
-    current_estimates = {
-        trait: TraitEstimate(
-            theta=data["theta"],
-            se=data["se"],
-            items_administered=data["items_administered"],
-            completed=data["completed"],
-        )
-        for trait, data in action["current_estimates"].items()
-    }
 
-    return DOSEStartResponse(
-        session_id=session.id,
-        message="Hi! I'm going to ask you some questions to understand your personality. This is an adaptive assessment - I'll select questions based on your responses to get the most accurate picture efficiently.",
-        current_item={
+    # Rendered directly by orjson; DOSEStartResponse documents the shape
+    return ORJSONResponse({
+        "session_id": session.id,
+        "message": "Hi! I'm going to ask you some questions to understand your personality. This is an adaptive assessment - I'll select questions based on your responses to get the most accurate picture efficiently.",
+        "current_item": {
             "number": action["item_number"],
             "text": action["item_text"],
             "trait": action["trait"],
         },
-        current_estimates=current_estimates,
-    )
+        "current_estimates": action["current_estimates"],
+    })
 
 
-@router.post("/{session_id}/respond", response_model=DOSERespondResponse)
+@router.post(
+    "/{session_id}/respond",
+    response_model=None,
+    responses={200: {"model": DOSERespondResponse}},
+)
 async def respond_dose_chatbot(
     session_id: str,
     data: DOSERespond,
@@ -130,9 +153,7 @@ async def respond_dose_chatbot(
 ):
     """Submit a response to the current item in DOSE chatbot."""
     # Verify session exists
-    result = await db.execute(
-        select(AssessmentSession).where(AssessmentSession.id == session_id)
-    )
+    result = await db.execute(_SESSION_BY_ID, {"session_id": session_id})
     session = result.scalar_one_or_none()
 
     if not session:
@@ -162,140 +183,141 @@ async def respond_dose_chatbot(
             detail="DOSE session state not found. Please restart the session."
         )
 
-    # Get current item to respond to
-    current_action = dose.get_next_action(dose_state)
-    if current_action["action"] == DOSEAction.COMPLETE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Assessment already complete"
-        )
-
-    current_item_num = current_action["item_number"]
-    current_item = MINI_IPIP6_ITEMS[current_item_num]
-
-    # Get theta/SE before update
-    trait = current_item["trait"]
-    theta_before = dose_state.trait_states[trait].theta_estimate
-    se_before = dose_state.trait_states[trait].standard_error
-
-    # Process response through DOSE algorithm
+    # Get current item to respond to (selected when it was presented;
+    # states saved before pending_item_number existed re-run the selection)
+    current_item_num = dose_state.pending_item_number
+    if current_item_num is None:
+        current_action = dose.get_next_action(dose_state)
+        if current_action["action"] == DOSEAction.COMPLETE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Assessment already complete"
+            )
+        current_item_num = current_action["item_number"]
+
+    # Process response through DOSE algorithm. The response and its IRT
+    # tracking data are recorded in dose_state.administered_items and
+    # written to item_responses in one batch when the session completes.
     dose_state = dose.process_response(dose_state, current_item_num, data.response_value)
 
-    # Get theta/SE after update
-    theta_after = dose_state.trait_states[trait].theta_estimate
-    se_after = dose_state.trait_states[trait].standard_error
-
-    # Calculate Fisher information
-    fisher_info = irt_engine.item_fisher_information(current_item_num, theta_before)
-
-    # Save response to database
-    response = ItemResponse(
-        session_id=session_id,
-        item_number=current_item_num,
-        trait=trait,
-        response_value=data.response_value,
-        presentation_order=dose_state.total_items,
-        theta_before=theta_before,
-        theta_after=theta_after,
-        se_before=se_before,
-        se_after=se_after,
-        fisher_information=fisher_info,
-    )
-    db.add(response)
-
     # Update session
     session.items_administered = dose_state.total_items
-    session.current_theta = {
-        t: dose_state.trait_states[t].theta_estimate for t in TRAITS
-    }
-    session.current_se = {
-        t: dose_state.trait_states[t].standard_error for t in TRAITS
-    }
+    current_theta = {}
+    current_se = {}
+    for t, ts in dose_state.trait_states.items():
+        current_theta[t] = ts.theta_estimate
+        current_se[t] = ts.standard_error
+    session.current_theta = current_theta
+    session.current_se = current_se
 
     # Get next action
     next_action = dose.get_next_action(dose_state)
 
-    # Build estimates
-    current_estimates = {
-        trait: TraitEstimate(
-            theta=est_data["theta"],
-            se=est_data["se"],
-            items_administered=est_data["items_administered"],
-            completed=est_data["completed"],
-        )
-        for trait, est_data in next_action["current_estimates"].items()
-    }
+    # Build estimates (responses are rendered directly by orjson, without
+    # Pydantic validation; DOSERespondResponse documents the shape)
+    current_estimates = next_action["current_estimates"]
 
-    progress = DOSEProgress(
-        items_administered=dose_state.total_items,
-        traits_completed=sum(dose_state.traits_completed.values()),
-        total_traits=6,
-    )
+    progress = {
+        "items_administered": dose_state.total_items,
+        "traits_completed": dose_state.n_traits_completed,
+        "total_traits": 6,
+    }
 
     if next_action["action"] == DOSEAction.COMPLETE:
-        # Assessment complete - save results
+        # Assessment complete - save all item responses in one bulk insert
+        history = dose_state.administered_items
+        await db.execute(
+            insert(ItemResponse),
+            [
+                {
+                    "id": response_id,
+                    "session_id": session_id,
+                    "item_number": h.item_number,
+                    "trait": h.trait,
+                    "response_value": h.response,
+                    "presentation_order": h.presentation_order,
+                    "theta_before": h.theta_before,
+                    "theta_after": h.theta_after,
+                    "se_before": h.se_before,
+                    "se_after": h.se_after,
+                    "fisher_information": h.fisher_information,
+                }
+                for response_id, h in zip(new_ids(len(history)), history)
+            ],
+        )
+
+        # Save results
         final_results = dose.get_final_results(dose_state)
 
-        # Calculate duration
-        duration = int((datetime.utcnow() - session.started_at).total_seconds())
-
-        # Create result with Likert-scale scores
-        result_obj = AssessmentResult(
-            session_id=session_id,
-            extraversion_score=final_results["trait_estimates"]["extraversion"]["likert_score"],
-            agreeableness_score=final_results["trait_estimates"]["agreeableness"]["likert_score"],
-            conscientiousness_score=final_results["trait_estimates"]["conscientiousness"]["likert_score"],
-            neuroticism_score=final_results["trait_estimates"]["neuroticism"]["likert_score"],
-            openness_score=final_results["trait_estimates"]["openness"]["likert_score"],
-            honesty_humility_score=final_results["trait_estimates"]["honesty_humility"]["likert_score"],
-            extraversion_se=final_results["trait_estimates"]["extraversion"]["standard_error"],
-            agreeableness_se=final_results["trait_estimates"]["agreeableness"]["standard_error"],
-            conscientiousness_se=final_results["trait_estimates"]["conscientiousness"]["standard_error"],
-            neuroticism_se=final_results["trait_estimates"]["neuroticism"]["standard_error"],
-            openness_se=final_results["trait_estimates"]["openness"]["standard_error"],
-            honesty_humility_se=final_results["trait_estimates"]["honesty_humility"]["standard_error"],
-            total_items_administered=final_results["total_items_administered"],
-            total_duration_seconds=duration,
-            item_reduction_rate=final_results["item_reduction_rate"],
+        # Calculate duration (one clock read, so it matches completed_at)
+        completed_at = datetime.utcnow()
+        duration = int((completed_at - session.started_at).total_seconds())
+
+        # Insert result with Likert-scale scores (Core insert, no ORM object)
+        await db.execute(
+            insert(AssessmentResult).values(
+                session_id=session_id,
+                extraversion_score=final_results["trait_estimates"]["extraversion"]["likert_score"],
+                agreeableness_score=final_results["trait_estimates"]["agreeableness"]["likert_score"],
+                conscientiousness_score=final_results["trait_estimates"]["conscientiousness"]["likert_score"],
+                neuroticism_score=final_results["trait_estimates"]["neuroticism"]["likert_score"],
+                openness_score=final_results["trait_estimates"]["openness"]["likert_score"],
+                honesty_humility_score=final_results["trait_estimates"]["honesty_humility"]["likert_score"],
+                extraversion_se=final_results["trait_estimates"]["extraversion"]["standard_error"],
+                agreeableness_se=final_results["trait_estimates"]["agreeableness"]["standard_error"],
+                conscientiousness_se=final_results["trait_estimates"]["conscientiousness"]["standard_error"],
+                neuroticism_se=final_results["trait_estimates"]["neuroticism"]["standard_error"],
+                openness_se=final_results["trait_estimates"]["openness"]["standard_error"],
+                honesty_humility_se=final_results["trait_estimates"]["honesty_humility"]["standard_error"],
+                total_items_administered=final_results["total_items_administered"],
+                total_duration_seconds=duration,
+                item_reduction_rate=final_results["item_reduction_rate"],
+            )
         )
-        db.add(result_obj)
 
         # Update session
         session.status = SessionStatus.COMPLETED
-        session.completed_at = datetime.utcnow()
+        session.completed_at = completed_at
         session.duration_seconds = duration
 
         # Clear the dose_state as it's no longer needed (results are saved)
         session.dose_state = None
 
+        # Add to the running aggregate totals
+        await record_session_completion(
+            db, SessionType.DOSE,
+            final_results["total_items_administered"], duration,
+            final_results["item_reduction_rate"],
+        )
+
         await db.commit()
 
-        return DOSERespondResponse(
-            session_id=session_id,
-            action="complete",
-            next_item=None,
-            current_estimates=current_estimates,
-            progress=progress,
-            stopping_reason=f"All traits estimated with sufficient precision (SE < {dose.se_threshold})",
-        )
+        return ORJSONResponse({
+            "session_id": session_id,
+            "action": "complete",
+            "next_item": None,
+            "current_estimates": current_estimates,
+            "progress": progress,
+            "stopping_reason": f"All traits estimated with sufficient precision (SE < {dose.se_threshold})",
+        })
     else:
         # Save updated DOSE state to database
         save_dose_state(session, dose_state)
 
         await db.commit()
 
-        return DOSERespondResponse(
-            session_id=session_id,
-            action="present_item",
-            next_item={
+        return ORJSONResponse({
+            "session_id": session_id,
+            "action": "present_item",
+            "next_item": {
                 "number": next_action["item_number"],
                 "text": next_action["item_text"],
                 "trait": next_action["trait"],
             },
-            current_estimates=current_estimates,
-            progress=progress,
-            stopping_reason=None,
-        )
+            "current_estimates": current_estimates,
+            "progress": progress,
+            "stopping_reason": None,
+        })
 
 
 @router.get("/{session_id}/state")
@@ -304,9 +326,7 @@ async def get_dose_state(
     db: AsyncSession = Depends(get_db)
 ):
     """Get current state of DOSE chatbot session."""
-    result = await db.execute(
-        select(AssessmentSession).where(AssessmentSession.id == session_id)
-    )
+    result = await db.execute(_SESSION_BY_ID, {"session_id": session_id})
     session = result.scalar_one_or_none()
 
     if not session:
@@ -324,7 +344,7 @@ async def get_dose_state(
         except (ValueError, KeyError):
             pass
 
-    return {
+    return ORJSONResponse({
         "session_id": session_id,
         "status": session.status.value,
         "items_administered": session.items_administered,
@@ -332,4 +352,4 @@ async def get_dose_state(
         "current_se": session.current_se,
         "traits_completed": traits_completed,
         "is_complete": session.status == SessionStatus.COMPLETED,
-    }
+    })
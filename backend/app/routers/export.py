@@ -3,25 +3,227 @@ import csv
 import io
 import json
 from datetime import datetime
+from operator import attrgetter
+from typing import Any, AsyncIterator, Dict, Tuple
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func
+from sqlalchemy.orm import load_only, raiseload, selectinload
 
-from ..core.database import get_db
+from ..core.database import get_db, async_session_maker, stream_partitions
+from ..core.mini_ipip6_data import TRAITS
 from ..models import (
     Participant, AssessmentSession, AssessmentResult,
-    SatisfactionSurvey, SessionStatus
+    SatisfactionSurvey, SessionStatus, SessionType
 )
+from ..services.counterbalancing import CONDITION_ORDERS
 
 router = APIRouter()
 
 
+# Column order of the participants CSV export
+CSV_HEADERS = [
+    # Participant info
+    'participant_id',
+    'participant_code',
+    'age',
+    'gender',
+    'condition_order',
+    'created_at',
+
+    # Survey results
+    'survey_completed',
+    'survey_extraversion',
+    'survey_agreeableness',
+    'survey_conscientiousness',
+    'survey_neuroticism',
+    'survey_openness',
+    'survey_honesty_humility',
+    'survey_duration_seconds',
+    'survey_items',
+
+    # DOSE results
+    'dose_completed',
+    'dose_extraversion',
+    'dose_agreeableness',
+    'dose_conscientiousness',
+    'dose_neuroticism',
+    'dose_openness',
+    'dose_honesty_humility',
+    'dose_extraversion_se',
+    'dose_agreeableness_se',
+    'dose_conscientiousness_se',
+    'dose_neuroticism_se',
+    'dose_openness_se',
+    'dose_honesty_humility_se',
+    'dose_duration_seconds',
+    'dose_items',
+    'dose_item_reduction_rate',
+
+    # Satisfaction survey
+    'satisfaction_completed',
+    'satisfaction_overall_rating',
+    'satisfaction_preferred_method',
+    'satisfaction_dose_ease_of_use',
+    'satisfaction_would_recommend',
+    'satisfaction_open_feedback',
+    'satisfaction_language',
+]
+
+
+# Attributes per CSV block, in CSV_HEADERS order
+_SURVEY_CSV_FIELDS = (
+    *(f"{t}_score" for t in TRAITS),
+    "total_duration_seconds", "total_items_administered",
+)
+_DOSE_CSV_FIELDS = (
+    *(f"{t}_score" for t in TRAITS),
+    *(f"{t}_se" for t in TRAITS),
+    "total_duration_seconds", "total_items_administered", "item_reduction_rate",
+)
+_SATISFACTION_CSV_FIELDS = (
+    "overall_rating", "preferred_method", "dose_ease_of_use",
+    "would_recommend", "open_feedback", "language",
+)
+_SURVEY_CSV_VALUES = attrgetter(*_SURVEY_CSV_FIELDS)
+_DOSE_CSV_VALUES = attrgetter(*_DOSE_CSV_FIELDS)
+_SATISFACTION_CSV_VALUES = attrgetter(*_SATISFACTION_CSV_FIELDS)
+
+# Participant columns read by both exports (condition_order derives from
+# latin_square_row)
+_EXPORT_PARTICIPANT_COLUMNS = load_only(
+    Participant.participant_code, Participant.age, Participant.gender,
+    Participant.latin_square_row, Participant.created_at,
+    raiseload=True,
+)
+
+# Loader options for the CSV export: only completed sessions, and only the
+# columns the CSV reads (the survey fields are a subset of the DOSE ones).
+# Unlisted columns and relationships raise instead of lazy loading.
+_CSV_EXPORT_OPTIONS = (
+    _EXPORT_PARTICIPANT_COLUMNS,
+    selectinload(
+        Participant.sessions.and_(
+            AssessmentSession.status == SessionStatus.COMPLETED
+        )
+    )
+    .load_only(
+        AssessmentSession.participant_id, AssessmentSession.session_type,
+        raiseload=True,
+    )
+    .selectinload(AssessmentSession.result)
+    .load_only(
+        AssessmentResult.session_id,
+        *(getattr(AssessmentResult, name) for name in _DOSE_CSV_FIELDS),
+        raiseload=True,
+    ),
+    selectinload(Participant.satisfaction_survey).load_only(
+        SatisfactionSurvey.participant_id,
+        *(getattr(SatisfactionSurvey, name) for name in _SATISFACTION_CSV_FIELDS),
+        raiseload=True,
+    ),
+    raiseload("*"),
+)
+
+# Loader options for the JSON export: results and satisfaction surveys are
+# exported whole, sessions without their DOSE/conversation state blobs
+_JSON_EXPORT_OPTIONS = (
+    _EXPORT_PARTICIPANT_COLUMNS,
+    selectinload(Participant.sessions)
+    .load_only(
+        AssessmentSession.participant_id, AssessmentSession.session_type,
+        AssessmentSession.sequence_number, AssessmentSession.status,
+        AssessmentSession.started_at, AssessmentSession.completed_at,
+        raiseload=True,
+    )
+    .selectinload(AssessmentSession.result),
+    selectinload(Participant.satisfaction_survey),
+    raiseload("*"),
+)
+
+# condition_order cell per latin_square_row, serialized once
+_CONDITION_ORDER_CELLS = tuple(json.dumps(list(order)) for order in CONDITION_ORDERS)
+
+# Cells for a block whose data is missing: completed flag False, then blanks
+_EMPTY_SURVEY = (False,) + ("",) * 8
+_EMPTY_DOSE = (False,) + ("",) * 15
+_EMPTY_SATISFACTION = (False,) + ("",) * 6
+
+
+def _participant_csv_row(participant: Participant) -> Tuple[Any, ...]:
+    """
+    Build one CSV export row as a tuple in CSV_HEADERS order.
+
+    The participant's completed sessions, their results and the
+    satisfaction survey must be loaded.
+    """
+    satisfaction = participant.satisfaction_survey
+    # Find survey and dose sessions (last completed one of each type wins);
+    # the loader only fetches completed sessions, so key by enum member
+    # without re-checking status
+    completed = {session.session_type: session for session in participant.sessions}
+    survey_session = completed.get(SessionType.SURVEY)
+    dose_session = completed.get(SessionType.DOSE)
+    survey_result = survey_session.result if survey_session else None
+    dose_result = dose_session.result if dose_session else None
+
+    return (
+        participant.id,
+        participant.participant_code,
+        participant.age,
+        participant.gender,
+        _CONDITION_ORDER_CELLS[participant.latin_square_row],
+        participant.created_at.isoformat() if participant.created_at else '',
+        *((True, *_SURVEY_CSV_VALUES(survey_result)) if survey_result
+          else _EMPTY_SURVEY),
+        *((True, *_DOSE_CSV_VALUES(dose_result)) if dose_result
+          else _EMPTY_DOSE),
+        *((True, *_SATISFACTION_CSV_VALUES(satisfaction)) if satisfaction
+          else _EMPTY_SATISFACTION),
+    )
+
+
+def _drain(buffer: io.StringIO) -> str:
+    """Return and clear everything written to the buffer so far."""
+    chunk = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return chunk
+
+
+async def _stream_participants_csv() -> AsyncIterator[str]:
+    """
+    Yield the CSV export, header first, then one chunk per fetched batch.
+
+    Async, so Starlette iterates it on the event loop rather than in a
+    threadpool; the rows of each batch are formatted synchronously and
+    sent together.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADERS)
+    yield _drain(buffer)
+
+    # The generator outlives the request dependency, so it owns its session
+    async with async_session_maker() as session:
+        # Stream participants in batches with their completed sessions,
+        # results and satisfaction survey
+        batches = stream_partitions(
+            session,
+            select(Participant)
+            .options(*_CSV_EXPORT_OPTIONS)
+            .order_by(Participant.created_at, Participant.id),
+            scalars=True,
+        )
+        async for batch in batches:
+            writer.writerows(map(_participant_csv_row, batch))
+            yield _drain(buffer)
+
+
 @router.get("/participants/csv")
-async def export_all_participants_csv(
-    db: AsyncSession = Depends(get_db)
-):
+async def export_all_participants_csv():
     """
     Export all participants' data as CSV.
 
@@ -31,267 +233,144 @@ async def export_all_participants_csv(
     - Survey results (scores for each trait)
     - DOSE results (scores for each trait)
     - Satisfaction survey responses
-    """
-    # Query all participants with related data
-    result = await db.execute(
-        select(Participant)
-        .options(
-            selectinload(Participant.sessions).selectinload(AssessmentSession.result)
-        )
-        .order_by(Participant.created_at)
-    )
-    participants = result.scalars().all()
-
-    # Query satisfaction surveys separately
-    satisfaction_result = await db.execute(select(SatisfactionSurvey))
-    satisfaction_surveys = {s.participant_id: s for s in satisfaction_result.scalars().all()}
-
-    # Create CSV in memory
-    output = io.StringIO()
-
-    # Define CSV headers
-    headers = [
-        # Participant info
-        'participant_id',
-        'participant_code',
-        'age',
-        'gender',
-        'condition_order',
-        'created_at',
-
-        # Survey results
-        'survey_completed',
-        'survey_extraversion',
-        'survey_agreeableness',
-        'survey_conscientiousness',
-        'survey_neuroticism',
-        'survey_openness',
-        'survey_honesty_humility',
-        'survey_duration_seconds',
-        'survey_items',
-
-        # DOSE results
-        'dose_completed',
-        'dose_extraversion',
-        'dose_agreeableness',
-        'dose_conscientiousness',
-        'dose_neuroticism',
-        'dose_openness',
-        'dose_honesty_humility',
-        'dose_extraversion_se',
-        'dose_agreeableness_se',
-        'dose_conscientiousness_se',
-        'dose_neuroticism_se',
-        'dose_openness_se',
-        'dose_honesty_humility_se',
-        'dose_duration_seconds',
-        'dose_items',
-        'dose_item_reduction_rate',
-
-        # Satisfaction survey
-        'satisfaction_completed',
-        'satisfaction_overall_rating',
-        'satisfaction_preferred_method',
-        'satisfaction_dose_ease_of_use',
-        'satisfaction_would_recommend',
-        'satisfaction_open_feedback',
-        'satisfaction_language',
-    ]
-
-    writer = csv.DictWriter(output, fieldnames=headers)
-    writer.writeheader()
-
-    for participant in participants:
-        row = {
-            'participant_id': participant.id,
-            'participant_code': participant.participant_code,
-            'age': participant.age,
-            'gender': participant.gender,
-            'condition_order': json.dumps(participant.condition_order),
-            'created_at': participant.created_at.isoformat() if participant.created_at else '',
-        }
 
-        # Find survey and dose sessions
-        survey_session = None
-        dose_session = None
-
-        for session in participant.sessions:
-            if session.session_type.value == 'survey' and session.status == SessionStatus.COMPLETED:
-                survey_session = session
-            elif session.session_type.value == 'dose' and session.status == SessionStatus.COMPLETED:
-                dose_session = session
-
-        # Survey results
-        if survey_session and survey_session.result:
-            result = survey_session.result
-            row.update({
-                'survey_completed': True,
-                'survey_extraversion': result.extraversion_score,
-                'survey_agreeableness': result.agreeableness_score,
-                'survey_conscientiousness': result.conscientiousness_score,
-                'survey_neuroticism': result.neuroticism_score,
-                'survey_openness': result.openness_score,
-                'survey_honesty_humility': result.honesty_humility_score,
-                'survey_duration_seconds': result.total_duration_seconds,
-                'survey_items': result.total_items_administered,
-            })
-        else:
-            row.update({
-                'survey_completed': False,
-                'survey_extraversion': '',
-                'survey_agreeableness': '',
-                'survey_conscientiousness': '',
-                'survey_neuroticism': '',
-                'survey_openness': '',
-                'survey_honesty_humility': '',
-                'survey_duration_seconds': '',
-                'survey_items': '',
-            })
-
-        # DOSE results
-        if dose_session and dose_session.result:
-            result = dose_session.result
-            row.update({
-                'dose_completed': True,
-                'dose_extraversion': result.extraversion_score,
-                'dose_agreeableness': result.agreeableness_score,
-                'dose_conscientiousness': result.conscientiousness_score,
-                'dose_neuroticism': result.neuroticism_score,
-                'dose_openness': result.openness_score,
-                'dose_honesty_humility': result.honesty_humility_score,
-                'dose_extraversion_se': result.extraversion_se,
-                'dose_agreeableness_se': result.agreeableness_se,
-                'dose_conscientiousness_se': result.conscientiousness_se,
-                'dose_neuroticism_se': result.neuroticism_se,
-                'dose_openness_se': result.openness_se,
-                'dose_honesty_humility_se': result.honesty_humility_se,
-                'dose_duration_seconds': result.total_duration_seconds,
-                'dose_items': result.total_items_administered,
-                'dose_item_reduction_rate': result.item_reduction_rate,
-            })
-        else:
-            row.update({
-                'dose_completed': False,
-                'dose_extraversion': '',
-                'dose_agreeableness': '',
-                'dose_conscientiousness': '',
-                'dose_neuroticism': '',
-                'dose_openness': '',
-                'dose_honesty_humility': '',
-                'dose_extraversion_se': '',
-                'dose_agreeableness_se': '',
-                'dose_conscientiousness_se': '',
-                'dose_neuroticism_se': '',
-                'dose_openness_se': '',
-                'dose_honesty_humility_se': '',
-                'dose_duration_seconds': '',
-                'dose_items': '',
-                'dose_item_reduction_rate': '',
-            })
-
-        # Satisfaction survey
-        satisfaction = satisfaction_surveys.get(participant.id)
-        if satisfaction:
-            row.update({
-                'satisfaction_completed': True,
-                'satisfaction_overall_rating': satisfaction.overall_rating,
-                'satisfaction_preferred_method': satisfaction.preferred_method,
-                'satisfaction_dose_ease_of_use': satisfaction.dose_ease_of_use,
-                'satisfaction_would_recommend': satisfaction.would_recommend,
-                'satisfaction_open_feedback': satisfaction.open_feedback or '',
-                'satisfaction_language': satisfaction.language,
-            })
-        else:
-            row.update({
-                'satisfaction_completed': False,
-                'satisfaction_overall_rating': '',
-                'satisfaction_preferred_method': '',
-                'satisfaction_dose_ease_of_use': '',
-                'satisfaction_would_recommend': '',
-                'satisfaction_open_feedback': '',
-                'satisfaction_language': '',
-            })
-
-        writer.writerow(row)
-
-    # Prepare response
-    output.seek(0)
+    Rows are streamed as they are produced, so the export is never held
+    in memory as a whole.
+    """
     timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
     filename = f"psychological_assessment_data_{timestamp}.csv"
 
     return StreamingResponse(
-        iter([output.getvalue()]),
+        _stream_participants_csv(),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
 
-@router.get("/participants/json")
-async def export_all_participants_json(
-    db: AsyncSession = Depends(get_db)
-):
+def _participant_json(participant: Participant) -> Dict[str, Any]:
     """
-    Export all participants' data as JSON.
+    Build one participant entry of the JSON export.
 
-    Returns a comprehensive JSON object with all participant data.
+    The participant's sessions, their results and the satisfaction
+    survey must be loaded.
     """
-    # Query all participants with related data
-    result = await db.execute(
-        select(Participant)
-        .options(
-            selectinload(Participant.sessions).selectinload(AssessmentSession.result)
+    satisfaction = participant.satisfaction_survey
+    participant_data = {
+        "id": participant.id,
+        "participant_code": participant.participant_code,
+        "demographics": {
+            "age": participant.age,
+            "gender": participant.gender,
+        },
+        "condition_order": participant.condition_order,
+        "created_at": participant.created_at.isoformat() if participant.created_at else None,
+        "sessions": [],
+        "satisfaction_survey": None,
+    }
+
+    for session in participant.sessions:
+        session_data = {
+            "session_id": session.id,
+            "session_type": session.session_type.value,
+            "sequence_number": session.sequence_number,
+            "status": session.status.value,
+            "started_at": session.started_at.isoformat() if session.started_at else None,
+            "completed_at": session.completed_at.isoformat() if session.completed_at else None,
+            "result": None,
+        }
+
+        if session.result:
+            session_data["result"] = session.result.to_dict()
+
+        participant_data["sessions"].append(session_data)
+
+    if satisfaction:
+        participant_data["satisfaction_survey"] = satisfaction.to_dict()
+
+    return participant_data
+
+
+async def _stream_participants_json() -> AsyncIterator[bytes]:
+    """
+    Yield the JSON export as one object, one participant at a time.
+
+    total_participants is counted in SQL and sent in the preamble, ahead
+    of the participants array.
+    """
+    # The generator outlives the request dependency, so it owns its session
+    async with async_session_maker() as session:
+        total = await session.scalar(select(func.count(Participant.id)))
+        yield (
+            b'{"export_timestamp":' + orjson.dumps(datetime.utcnow().isoformat())
+            + b',"total_participants":' + str(total).encode()
+            + b',"participants":['
         )
-        .order_by(Participant.created_at)
-    )
-    participants = result.scalars().all()
 
-    # Query satisfaction surveys separately
-    satisfaction_result = await db.execute(select(SatisfactionSurvey))
-    satisfaction_surveys = {s.participant_id: s for s in satisfaction_result.scalars().all()}
+        # Stream participants in batches with their sessions, results and
+        # satisfaction survey
+        batches = stream_partitions(
+            session,
+            select(Participant)
+            .options(*_JSON_EXPORT_OPTIONS)
+            .order_by(Participant.created_at, Participant.id),
+            scalars=True,
+        )
+        first = True
+        async for batch in batches:
+            for participant in batch:
+                entry = orjson.dumps(_participant_json(participant))
+                yield entry if first else b"," + entry
+                first = False
 
-    export_data = {
-        "export_timestamp": datetime.utcnow().isoformat(),
-        "total_participants": len(participants),
-        "participants": []
-    }
+    yield b"]}"
 
-    for participant in participants:
-        participant_data = {
-            "id": participant.id,
-            "participant_code": participant.participant_code,
-            "demographics": {
-                "age": participant.age,
-                "gender": participant.gender,
-            },
-            "condition_order": participant.condition_order,
-            "created_at": participant.created_at.isoformat() if participant.created_at else None,
-            "sessions": [],
-            "satisfaction_survey": None,
-        }
 
-        for session in participant.sessions:
-            session_data = {
-                "session_id": session.id,
-                "session_type": session.session_type.value,
-                "sequence_number": session.sequence_number,
-                "status": session.status.value,
-                "started_at": session.started_at.isoformat() if session.started_at else None,
-                "completed_at": session.completed_at.isoformat() if session.completed_at else None,
-                "result": None,
-            }
+@router.get("/participants/json")
+async def export_all_participants_json():
+    """
+    Export all participants' data as JSON.
 
-            if session.result:
-                session_data["result"] = session.result.to_dict()
+    Returns a comprehensive JSON object with all participant data,
+    serialized with orjson and streamed one participant at a time.
+    """
+    return StreamingResponse(
+        _stream_participants_json(),
+        media_type="application/json",
+    )
 
-            participant_data["sessions"].append(session_data)
 
-        satisfaction = satisfaction_surveys.get(participant.id)
-        if satisfaction:
-            participant_data["satisfaction_survey"] = satisfaction.to_dict()
+def _completed_count(session_type: SessionType):
+    """Scalar subquery counting completed sessions of one type."""
+    return (
+        select(func.count())
+        .select_from(AssessmentSession)
+        .where(AssessmentSession.status == SessionStatus.COMPLETED)
+        .where(AssessmentSession.session_type == session_type)
+        .scalar_subquery()
+    )
 
-        export_data["participants"].append(participant_data)
 
-    return export_data
+# Participants with a completed session of both assessment types
+_both_completed = (
+    select(AssessmentSession.participant_id)
+    .where(AssessmentSession.status == SessionStatus.COMPLETED)
+    .where(AssessmentSession.session_type.in_([SessionType.SURVEY, SessionType.DOSE]))
+    .group_by(AssessmentSession.participant_id)
+    .having(func.count(func.distinct(AssessmentSession.session_type)) == 2)
+    .subquery()
+)
+
+# All summary counts, computed by the database in a single statement
+SUMMARY_COUNTS_QUERY = select(
+    select(func.count()).select_from(Participant).scalar_subquery()
+    .label("total_participants"),
+    _completed_count(SessionType.SURVEY).label("survey_completed"),
+    _completed_count(SessionType.DOSE).label("dose_completed"),
+    select(func.count()).select_from(_both_completed).scalar_subquery()
+    .label("both_assessments_completed"),
+    select(func.count()).select_from(SatisfactionSurvey).scalar_subquery()
+    .label("satisfaction_surveys_completed"),
+)
 
 
 @router.get("/summary")
@@ -303,43 +382,82 @@ async def get_data_summary(
 
     Useful for admin dashboard to see data collection progress.
     """
-    # Count participants
-    result = await db.execute(select(Participant))
-    participants = result.scalars().all()
-    total_participants = len(participants)
-
-    # Count completed sessions by type
-    result = await db.execute(
-        select(AssessmentSession)
-        .where(AssessmentSession.status == SessionStatus.COMPLETED)
-    )
-    completed_sessions = result.scalars().all()
-
-    survey_completed = sum(1 for s in completed_sessions if s.session_type.value == 'survey')
-    dose_completed = sum(1 for s in completed_sessions if s.session_type.value == 'dose')
-
-    # Count satisfaction surveys
-    result = await db.execute(select(SatisfactionSurvey))
-    satisfaction_count = len(result.scalars().all())
-
-    # Count fully completed (both assessments + satisfaction)
-    fully_completed = 0
-    for p in participants:
-        sessions = [s for s in completed_sessions if s.participant_id == p.id]
-        has_survey = any(s.session_type.value == 'survey' for s in sessions)
-        has_dose = any(s.session_type.value == 'dose' for s in sessions)
-        has_satisfaction = any(s.participant_id == p.id for s in completed_sessions)
-        if has_survey and has_dose:
-            fully_completed += 1
+    counts = (await db.execute(SUMMARY_COUNTS_QUERY)).one()
 
     return {
-        "total_participants": total_participants,
-        "survey_completed": survey_completed,
-        "dose_completed": dose_completed,
-        "both_assessments_completed": fully_completed,
-        "satisfaction_surveys_completed": satisfaction_count,
+        "total_participants": counts.total_participants,
+        "survey_completed": counts.survey_completed,
+        "dose_completed": counts.dose_completed,
+        "both_assessments_completed": counts.both_assessments_completed,
+        "satisfaction_surveys_completed": counts.satisfaction_surveys_completed,
         "export_endpoints": {
             "csv": "/api/export/participants/csv",
             "json": "/api/export/participants/json",
+            "ndjson": "/api/export/results/ndjson",
         }
     }
+
+
+# Flat per-session result rows for the NDJSON export (Core columns, no ORM)
+_sessions = AssessmentSession.__table__.c
+_results = AssessmentResult.__table__.c
+_participants = Participant.__table__.c
+
+RESULT_ROWS_QUERY = (
+    select(
+        _participants.participant_code,
+        _sessions.participant_id,
+        _sessions.id.label("session_id"),
+        _sessions.session_type,
+        _sessions.sequence_number,
+        _sessions.status,
+        _sessions.started_at,
+        _sessions.completed_at,
+        _results.extraversion_score,
+        _results.agreeableness_score,
+        _results.conscientiousness_score,
+        _results.neuroticism_score,
+        _results.openness_score,
+        _results.honesty_humility_score,
+        _results.extraversion_se,
+        _results.agreeableness_se,
+        _results.conscientiousness_se,
+        _results.neuroticism_se,
+        _results.openness_se,
+        _results.honesty_humility_se,
+        _results.total_items_administered,
+        _results.total_duration_seconds,
+        _results.item_reduction_rate,
+        _results.created_at.label("result_created_at"),
+    )
+    .select_from(AssessmentResult.__table__)
+    .join(AssessmentSession.__table__, _results.session_id == _sessions.id)
+    .join(Participant.__table__, _sessions.participant_id == _participants.id)
+    .order_by(_participants.created_at, _participants.id, _sessions.sequence_number)
+)
+
+
+async def _stream_result_rows() -> AsyncIterator[bytes]:
+    """Yield one NDJSON line per completed session result."""
+    # The generator outlives the request dependency, so it owns its session
+    async with async_session_maker() as session:
+        async for batch in stream_partitions(session, RESULT_ROWS_QUERY):
+            yield b"".join(orjson.dumps(row._asdict()) + b"\n" for row in batch)
+
+
+@router.get("/results/ndjson")
+async def export_results_ndjson():
+    """
+    Export every session result as newline-delimited JSON.
+
+    One object per line, streamed straight from a Core query so memory
+    stays flat regardless of the number of participants.
+    """
+    timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+    filename = f"psychological_assessment_results_{timestamp}.ndjson"
+
+    return StreamingResponse(
+        _stream_result_rows(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
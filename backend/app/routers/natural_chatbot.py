@@ -2,9 +2,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, literal, bindparam
 from datetime import datetime
-from typing import List, Dict
 import json
 
 from ..core.database import get_db
@@ -20,12 +19,18 @@ from ..schemas import (
 )
 from ..services.llm_service import LLMService, llm_service
 from ..services.counterbalancing import get_sequence_number
-from ..config import settings
+from ..config import Settings, get_settings
+from ..utils import new_id, new_ids
 
 router = APIRouter()
 
-# In-memory conversation storage (in production, use Redis or database)
-_conversations: Dict[str, List[Dict[str, str]]] = {}
+# Lookup statements built once at import, executed with bound parameters
+_PARTICIPANT_BY_ID = select(Participant).where(
+    Participant.id == bindparam("participant_id")
+)
+_SESSION_BY_ID = select(AssessmentSession).where(
+    AssessmentSession.id == bindparam("session_id")
+)
 
 
 def get_llm_service() -> LLMService:
@@ -49,7 +54,7 @@ async def start_natural_chatbot(
 
     # Verify participant exists
     result = await db.execute(
-        select(Participant).where(Participant.id == participant_id)
+        _PARTICIPANT_BY_ID, {"participant_id": participant_id}
     )
     participant = result.scalar_one_or_none()
 
@@ -59,14 +64,15 @@ async def start_natural_chatbot(
             detail="Participant not found"
         )
 
-    # Check if natural chatbot already completed
-    result = await db.execute(
-        select(AssessmentSession)
+    # Check if natural chatbot already completed (presence only, no ORM object)
+    already_completed = await db.scalar(
+        select(literal(1))
         .where(AssessmentSession.participant_id == participant_id)
         .where(AssessmentSession.session_type == SessionType.NATURAL)
         .where(AssessmentSession.status == SessionStatus.COMPLETED)
+        .limit(1)
     )
-    if result.scalar_one_or_none():
+    if already_completed:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Natural chatbot already completed for this participant"
@@ -75,31 +81,28 @@ async def start_natural_chatbot(
     # Get sequence number
     sequence = get_sequence_number(participant.condition_order, "natural")
 
-    # Create new session
-    session = AssessmentSession(
-        participant_id=participant_id,
-        session_type=SessionType.NATURAL,
-        sequence_number=sequence,
-        status=SessionStatus.IN_PROGRESS,
-        turn_count=0,
-    )
-
-    db.add(session)
-    await db.commit()
-    await db.refresh(session)
-
     # Initialize conversation with system prompt
     system_prompt = llm.get_system_prompt()
     conversation = [
         {"role": "system", "content": system_prompt}
     ]
 
-    # Generate initial greeting
+    # Generate initial greeting (before any writes, so a failed LLM call
+    # leaves no half-created session behind)
     initial_message = await llm.generate_response(conversation)
     conversation.append({"role": "assistant", "content": initial_message})
 
-    # Store conversation
-    _conversations[session.id] = conversation
+    # Create new session with the conversation stored on it (shared by all
+    # workers); the id is assigned up front so the chat log can reference it
+    session = AssessmentSession(
+        id=new_id(),
+        participant_id=participant_id,
+        session_type=SessionType.NATURAL,
+        sequence_number=sequence,
+        status=SessionStatus.IN_PROGRESS,
+        turn_count=1,
+        conversation_state=conversation,
+    )
 
     # Save initial chat log
     chat_log = ChatLog(
@@ -108,10 +111,9 @@ async def start_natural_chatbot(
         role="assistant",
         content=initial_message,
     )
-    db.add(chat_log)
 
-    # Update session
-    session.turn_count = 1
+    # Session and chat log are written in one commit
+    db.add_all([session, chat_log])
     await db.commit()
 
     return NaturalStartResponse(
@@ -126,7 +128,8 @@ async def send_message(
     session_id: str,
     data: NaturalMessage,
     db: AsyncSession = Depends(get_db),
-    llm: LLMService = Depends(get_llm_service)
+    llm: LLMService = Depends(get_llm_service),
+    settings: Settings = Depends(get_settings)
 ):
     """Send a message to the natural chatbot and get a response."""
     if not llm.is_configured():
@@ -137,7 +140,7 @@ async def send_message(
 
     # Verify session exists
     result = await db.execute(
-        select(AssessmentSession).where(AssessmentSession.id == session_id)
+        _SESSION_BY_ID, {"session_id": session_id}
     )
     session = result.scalar_one_or_none()
 
@@ -159,8 +162,8 @@ async def send_message(
             detail="Session already completed"
         )
 
-    # Get conversation
-    conversation = _conversations.get(session_id)
+    # Get conversation (copied: the JSON column only detects reassignment)
+    conversation = list(session.conversation_state or ())
     if not conversation:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -170,29 +173,35 @@ async def send_message(
     # Add user message
     conversation.append({"role": "user", "content": data.content})
 
-    # Save user chat log
-    user_log = ChatLog(
-        session_id=session_id,
-        turn_number=session.turn_count,
-        role="user",
-        content=data.content,
-    )
-    db.add(user_log)
-
     # Generate response
     response_text = await llm.generate_response(conversation)
     conversation.append({"role": "assistant", "content": response_text})
 
-    # Save assistant chat log
-    assistant_log = ChatLog(
-        session_id=session_id,
-        turn_number=session.turn_count + 1,
-        role="assistant",
-        content=response_text,
+    # User and assistant chat logs in one Core insert (write-only rows,
+    # committed with the session update)
+    user_log_id, assistant_log_id = new_ids(2)
+    await db.execute(
+        insert(ChatLog),
+        [
+            {
+                "id": user_log_id,
+                "session_id": session_id,
+                "turn_number": session.turn_count,
+                "role": "user",
+                "content": data.content,
+            },
+            {
+                "id": assistant_log_id,
+                "session_id": session_id,
+                "turn_number": session.turn_count + 1,
+                "role": "assistant",
+                "content": response_text,
+            },
+        ],
     )
-    db.add(assistant_log)
 
     # Update session
+    session.conversation_state = conversation
     session.turn_count += 2  # User + Assistant
 
     # Check if minimum turns reached
@@ -212,7 +221,8 @@ async def send_message(
 async def analyze_conversation(
     session_id: str,
     db: AsyncSession = Depends(get_db),
-    llm: LLMService = Depends(get_llm_service)
+    llm: LLMService = Depends(get_llm_service),
+    settings: Settings = Depends(get_settings)
 ):
     """Analyze the conversation to infer personality traits."""
     if not llm.is_configured():
@@ -223,7 +233,7 @@ async def analyze_conversation(
 
     # Verify session exists
     result = await db.execute(
-        select(AssessmentSession).where(AssessmentSession.id == session_id)
+        _SESSION_BY_ID, {"session_id": session_id}
     )
     session = result.scalar_one_or_none()
 
@@ -240,7 +250,7 @@ async def analyze_conversation(
         )
 
     # Get conversation
-    conversation = _conversations.get(session_id)
+    conversation = session.conversation_state
     if not conversation:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -259,32 +269,34 @@ async def analyze_conversation(
     inference_result = await llm.analyze_personality(conversation)
     validated_result = llm.validate_inference_result(inference_result)
 
-    # Calculate duration
-    duration = int((datetime.utcnow() - session.started_at).total_seconds())
-
-    # Create result
-    result_obj = AssessmentResult(
-        session_id=session_id,
-        extraversion_score=validated_result["extraversion"]["score"],
-        agreeableness_score=validated_result["agreeableness"]["score"],
-        conscientiousness_score=validated_result["conscientiousness"]["score"],
-        neuroticism_score=validated_result["neuroticism"]["score"],
-        openness_score=validated_result["openness"]["score"],
-        honesty_humility_score=validated_result["honesty_humility"]["score"],
-        llm_reasoning=validated_result,
-        conversation_turns=exchanges,
-        total_items_administered=0,  # No items in natural chatbot
-        total_duration_seconds=duration,
+    # Calculate duration (one clock read, so it matches completed_at)
+    completed_at = datetime.utcnow()
+    duration = int((completed_at - session.started_at).total_seconds())
+
+    # Create result (Core insert, no ORM object)
+    await db.execute(
+        insert(AssessmentResult).values(
+            session_id=session_id,
+            extraversion_score=validated_result["extraversion"]["score"],
+            agreeableness_score=validated_result["agreeableness"]["score"],
+            conscientiousness_score=validated_result["conscientiousness"]["score"],
+            neuroticism_score=validated_result["neuroticism"]["score"],
+            openness_score=validated_result["openness"]["score"],
+            honesty_humility_score=validated_result["honesty_humility"]["score"],
+            llm_reasoning=validated_result,
+            conversation_turns=exchanges,
+            total_items_administered=0,  # No items in natural chatbot
+            total_duration_seconds=duration,
+        )
     )
-    db.add(result_obj)
 
     # Update session
     session.status = SessionStatus.COMPLETED
-    session.completed_at = datetime.utcnow()
+    session.completed_at = completed_at
     session.duration_seconds = duration
 
-    # Clean up conversation
-    del _conversations[session_id]
+    # Clear the stored conversation (the transcript remains in chat_logs)
+    session.conversation_state = None
 
     await db.commit()
 
@@ -314,7 +326,7 @@ async def get_conversation_history(
     """Get the conversation history for a session."""
     # Verify session exists
     result = await db.execute(
-        select(AssessmentSession).where(AssessmentSession.id == session_id)
+        _SESSION_BY_ID, {"session_id": session_id}
     )
     session = result.scalar_one_or_none()
 
@@ -349,11 +361,12 @@ async def get_conversation_history(
 @router.get("/{session_id}/state")
 async def get_natural_state(
     session_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    settings: Settings = Depends(get_settings)
 ):
     """Get current state of natural chatbot session."""
     result = await db.execute(
-        select(AssessmentSession).where(AssessmentSession.id == session_id)
+        _SESSION_BY_ID, {"session_id": session_id}
     )
     session = result.scalar_one_or_none()
 
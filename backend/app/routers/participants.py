@@ -1,19 +1,32 @@
 """Participant management API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, bindparam
 from typing import List
 
 from ..core.database import get_db
-from ..models import Participant, AssessmentSession, SessionStatus
+from ..models import Participant, AssessmentSession, SessionStatus, participant_counter
 from ..schemas import ParticipantCreate, ParticipantResponse, ParticipantProgress
 from ..services.counterbalancing import assign_condition_order, get_next_condition
 
 router = APIRouter()
 
+# Lookup statements built once at import, executed with bound parameters
+_PARTICIPANT_BY_ID = select(Participant).where(
+    Participant.id == bindparam("participant_id")
+)
+
 
 async def get_next_participant_number(db: AsyncSession) -> int:
-    """Get the next participant number."""
+    """
+    Get the next participant number.
+
+    Uses the participant_counter sequence where the database supports
+    sequences: no table scan, and concurrent registrations never get the
+    same number. SQLite (single writer, development only) counts rows.
+    """
+    if db.get_bind().dialect.supports_sequences:
+        return await db.scalar(select(participant_counter.next_value()))
     result = await db.execute(select(func.count(Participant.id)))
     count = result.scalar()
     return count + 1
@@ -48,12 +61,10 @@ async def register_participant(
         gender=data.gender,
         education_level=data.education_level,
         latin_square_row=assignment["latin_square_row"],
-        condition_order=assignment["condition_order"],
     )
 
     db.add(participant)
     await db.commit()
-    await db.refresh(participant)
 
     return participant
 
@@ -65,7 +76,7 @@ async def get_participant(
 ):
     """Get participant by ID."""
     result = await db.execute(
-        select(Participant).where(Participant.id == participant_id)
+        _PARTICIPANT_BY_ID, {"participant_id": participant_id}
     )
     participant = result.scalar_one_or_none()
 
@@ -106,7 +117,7 @@ async def get_participant_progress(
     """Get participant's assessment progress."""
     # Get participant
     result = await db.execute(
-        select(Participant).where(Participant.id == participant_id)
+        _PARTICIPANT_BY_ID, {"participant_id": participant_id}
     )
     participant = result.scalar_one_or_none()
 
@@ -116,14 +127,13 @@ async def get_participant_progress(
             detail="Participant not found"
         )
 
-    # Get completed sessions
-    result = await db.execute(
-        select(AssessmentSession)
+    # Get completed session types (column only, no ORM objects)
+    completed_types = await db.scalars(
+        select(AssessmentSession.session_type)
         .where(AssessmentSession.participant_id == participant_id)
         .where(AssessmentSession.status == SessionStatus.COMPLETED)
     )
-    completed_sessions = result.scalars().all()
-    completed_conditions = [s.session_type.value for s in completed_sessions]
+    completed_conditions = [t.value for t in completed_types]
 
     # Determine next condition
     next_condition = get_next_condition(
@@ -149,10 +159,13 @@ async def list_participants(
     db: AsyncSession = Depends(get_db)
 ):
     """List all participants."""
+    # Bounded page ordered by the indexed created_at column; created_at can
+    # tie (second precision on SQLite), so the time-ordered id breaks ties
+    # and keeps pages from skipping or repeating rows
     result = await db.execute(
         select(Participant)
         .offset(skip)
         .limit(limit)
-        .order_by(Participant.created_at.desc())
+        .order_by(Participant.created_at.desc(), Participant.id.desc())
     )
     return result.scalars().all()
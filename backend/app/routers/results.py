@@ -1,18 +1,47 @@
 """Results API endpoints."""
+import logging
+import time
+from collections import OrderedDict
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List, Optional
+from sqlalchemy import select, func, bindparam
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import selectinload
+from typing import Any, Dict, List, Optional
 
+from ..config import settings
 from ..core.database import get_db
+from ..core.responses import ORJSONResponse
 from ..core.mini_ipip6_data import TRAITS
 from ..models import (
     Participant, AssessmentSession, SessionType, SessionStatus,
-    AssessmentResult
+    AssessmentResult, SessionTypeStats
 )
 from ..services.scoring_service import compare_scores
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Lookup statements built once at import, executed with bound parameters
+_PARTICIPANT_BY_ID = select(Participant).where(
+    Participant.id == bindparam("participant_id")
+)
+
+# Payloads are returned as ORJSONResponse so orjson renders them directly
+# (datetimes included), skipping FastAPI's jsonable_encoder pass.
+
+# Per-worker response caches. Results of a completed session never change,
+# so they are kept until evicted (least recently used first); the aggregate
+# is recomputed at most once per AGGREGATE_CACHE_SECONDS.
+_session_results_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_aggregate_cache: Dict[str, Any] = {"expires_at": 0.0, "payload": None}
+
+
+def _cache_session_results(session_id: str, payload: Dict[str, Any]) -> None:
+    """Store a completed session's results, evicting the oldest if full."""
+    _session_results_cache[session_id] = payload
+    if len(_session_results_cache) > settings.SESSION_RESULTS_CACHE_SIZE:
+        _session_results_cache.popitem(last=False)
 
 
 @router.get("/session/{session_id}")
@@ -21,57 +50,49 @@ async def get_session_results(
     db: AsyncSession = Depends(get_db)
 ):
     """Get results for a specific session."""
-    # Get session
+    cached = _session_results_cache.get(session_id)
+    if cached is not None:
+        _session_results_cache.move_to_end(session_id)
+        return ORJSONResponse(cached)
+
+    # Get session and its result (if any) in one query
     result = await db.execute(
-        select(AssessmentSession).where(AssessmentSession.id == session_id)
+        select(AssessmentSession, AssessmentResult)
+        .outerjoin(AssessmentResult, AssessmentResult.session_id == AssessmentSession.id)
+        .where(AssessmentSession.id == session_id)
     )
-    session = result.scalar_one_or_none()
+    row = result.first()
 
-    if not session:
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Session not found"
         )
 
+    session, assessment_result = row
+
     if session.status != SessionStatus.COMPLETED:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Session not completed yet"
         )
 
-    # Get result
-    result = await db.execute(
-        select(AssessmentResult).where(AssessmentResult.session_id == session_id)
-    )
-    assessment_result = result.scalar_one_or_none()
-
     if not assessment_result:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Results not found"
         )
 
-    return {
+    payload = {
         "session_id": session_id,
         "session_type": session.session_type.value,
         "sequence_number": session.sequence_number,
-        "completed_at": session.completed_at.isoformat() if session.completed_at else None,
-        "scores": {
-            "extraversion": assessment_result.extraversion_score,
-            "agreeableness": assessment_result.agreeableness_score,
-            "conscientiousness": assessment_result.conscientiousness_score,
-            "neuroticism": assessment_result.neuroticism_score,
-            "openness": assessment_result.openness_score,
-            "honesty_humility": assessment_result.honesty_humility_score,
-        },
-        "standard_errors": {
-            "extraversion": assessment_result.extraversion_se,
-            "agreeableness": assessment_result.agreeableness_se,
-            "conscientiousness": assessment_result.conscientiousness_se,
-            "neuroticism": assessment_result.neuroticism_se,
-            "openness": assessment_result.openness_se,
-            "honesty_humility": assessment_result.honesty_humility_se,
-        } if session.session_type == SessionType.DOSE else None,
+        "completed_at": session.completed_at,
+        "scores": assessment_result.get_scores_dict(),
+        "standard_errors": (
+            assessment_result.get_standard_errors_dict()
+            if session.session_type == SessionType.DOSE else None
+        ),
         "metrics": {
             "total_items": assessment_result.total_items_administered,
             "duration_seconds": assessment_result.total_duration_seconds,
@@ -79,6 +100,8 @@ async def get_session_results(
             "conversation_turns": assessment_result.conversation_turns,
         },
     }
+    _cache_session_results(session_id, payload)
+    return ORJSONResponse(payload)
 
 
 @router.get("/participant/{participant_id}")
@@ -89,7 +112,7 @@ async def get_participant_results(
     """Get all results for a participant with comparison."""
     # Get participant
     result = await db.execute(
-        select(Participant).where(Participant.id == participant_id)
+        _PARTICIPANT_BY_ID, {"participant_id": participant_id}
     )
     participant = result.scalar_one_or_none()
 
@@ -99,9 +122,10 @@ async def get_participant_results(
             detail="Participant not found"
         )
 
-    # Get completed sessions with results
+    # Get completed sessions with their results (one extra query in total)
     result = await db.execute(
         select(AssessmentSession)
+        .options(selectinload(AssessmentSession.result))
         .where(AssessmentSession.participant_id == participant_id)
         .where(AssessmentSession.status == SessionStatus.COMPLETED)
         .order_by(AssessmentSession.sequence_number)
@@ -113,21 +137,10 @@ async def get_participant_results(
     scores_by_type = {}
 
     for session in sessions:
-        # Get result
-        result = await db.execute(
-            select(AssessmentResult).where(AssessmentResult.session_id == session.id)
-        )
-        assessment_result = result.scalar_one_or_none()
+        assessment_result = session.result
 
         if assessment_result:
-            scores = {
-                "extraversion": assessment_result.extraversion_score,
-                "agreeableness": assessment_result.agreeableness_score,
-                "conscientiousness": assessment_result.conscientiousness_score,
-                "neuroticism": assessment_result.neuroticism_score,
-                "openness": assessment_result.openness_score,
-                "honesty_humility": assessment_result.honesty_humility_score,
-            }
+            scores = assessment_result.get_scores_dict()
 
             scores_by_type[session.session_type.value] = scores
 
@@ -151,14 +164,14 @@ async def get_participant_results(
             if session_type != "survey":
                 comparisons[session_type] = compare_scores(survey_scores, scores)
 
-    return {
+    return ORJSONResponse({
         "participant_id": participant_id,
         "participant_code": participant.participant_code,
         "condition_order": participant.condition_order,
         "sessions_completed": len(sessions),
         "sessions": session_results,
         "comparisons_with_survey": comparisons if comparisons else None,
-    }
+    })
 
 
 @router.get("/comparison/{participant_id}/{type1}/{type2}")
@@ -176,42 +189,27 @@ async def compare_session_types(
             detail=f"Invalid session type. Must be one of: {valid_types}"
         )
 
-    # Get sessions
+    # Get both completed sessions' results (None if missing) in one query
     type1_enum = SessionType(type1)
     type2_enum = SessionType(type2)
 
-    result1 = await db.execute(
-        select(AssessmentSession)
-        .where(AssessmentSession.participant_id == participant_id)
-        .where(AssessmentSession.session_type == type1_enum)
-        .where(AssessmentSession.status == SessionStatus.COMPLETED)
-    )
-    session1 = result1.scalar_one_or_none()
-
-    result2 = await db.execute(
-        select(AssessmentSession)
+    result = await db.execute(
+        select(AssessmentSession.session_type, AssessmentResult)
+        .outerjoin(AssessmentResult, AssessmentResult.session_id == AssessmentSession.id)
         .where(AssessmentSession.participant_id == participant_id)
-        .where(AssessmentSession.session_type == type2_enum)
+        .where(AssessmentSession.session_type.in_((type1_enum, type2_enum)))
         .where(AssessmentSession.status == SessionStatus.COMPLETED)
     )
-    session2 = result2.scalar_one_or_none()
+    results_by_type = dict(result.all())
 
-    if not session1 or not session2:
+    if type1_enum not in results_by_type or type2_enum not in results_by_type:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="One or both session types not completed"
         )
 
-    # Get results
-    r1 = await db.execute(
-        select(AssessmentResult).where(AssessmentResult.session_id == session1.id)
-    )
-    result1_obj = r1.scalar_one_or_none()
-
-    r2 = await db.execute(
-        select(AssessmentResult).where(AssessmentResult.session_id == session2.id)
-    )
-    result2_obj = r2.scalar_one_or_none()
+    result1_obj = results_by_type[type1_enum]
+    result2_obj = results_by_type[type2_enum]
 
     if not result1_obj or not result2_obj:
         raise HTTPException(
@@ -220,27 +218,12 @@ async def compare_session_types(
         )
 
     # Build score dicts
-    scores1 = {
-        "extraversion": result1_obj.extraversion_score,
-        "agreeableness": result1_obj.agreeableness_score,
-        "conscientiousness": result1_obj.conscientiousness_score,
-        "neuroticism": result1_obj.neuroticism_score,
-        "openness": result1_obj.openness_score,
-        "honesty_humility": result1_obj.honesty_humility_score,
-    }
-
-    scores2 = {
-        "extraversion": result2_obj.extraversion_score,
-        "agreeableness": result2_obj.agreeableness_score,
-        "conscientiousness": result2_obj.conscientiousness_score,
-        "neuroticism": result2_obj.neuroticism_score,
-        "openness": result2_obj.openness_score,
-        "honesty_humility": result2_obj.honesty_humility_score,
-    }
+    scores1 = result1_obj.get_scores_dict()
+    scores2 = result2_obj.get_scores_dict()
 
     comparison = compare_scores(scores1, scores2)
 
-    return {
+    return ORJSONResponse({
         "participant_id": participant_id,
         "type1": type1,
         "type2": type2,
@@ -249,52 +232,68 @@ async def compare_session_types(
             type2: scores2,
         },
         "comparison": comparison,
-    }
+    })
 
 
-@router.get("/aggregate")
-async def get_aggregate_results(
-    db: AsyncSession = Depends(get_db)
-):
-    """Get aggregate results across all participants (admin/research endpoint)."""
-    # Count participants
-    result = await db.execute(select(Participant))
-    participants = result.scalars().all()
-
-    # Count completed sessions by type
-    session_counts = {}
-    for session_type in SessionType:
-        result = await db.execute(
-            select(AssessmentSession)
-            .where(AssessmentSession.session_type == session_type)
-            .where(AssessmentSession.status == SessionStatus.COMPLETED)
-        )
-        sessions = result.scalars().all()
-        session_counts[session_type.value] = len(sessions)
+async def _compute_aggregate_results(db: AsyncSession) -> Dict[str, Any]:
+    """Compute the aggregate results payload."""
+    # Count participants (in SQL, without loading the rows)
+    total_participants = await db.scalar(select(func.count(Participant.id)))
 
-    # Calculate average metrics for DOSE sessions
-    result = await db.execute(
-        select(AssessmentResult)
-        .join(AssessmentSession)
-        .where(AssessmentSession.session_type == SessionType.DOSE)
-    )
-    dose_results = result.scalars().all()
+    # Completed-session counts and DOSE averages from the running totals
+    # kept by the completion handlers (one row per session type)
+    stats = {
+        row.session_type: row
+        for row in await db.scalars(select(SessionTypeStats))
+    }
+    session_counts = {
+        t.value: stats[t].completed_count if t in stats else 0
+        for t in SessionType
+    }
 
     dose_metrics = None
-    if dose_results:
-        avg_items = sum(r.total_items_administered for r in dose_results) / len(dose_results)
-        avg_reduction = sum(r.item_reduction_rate or 0 for r in dose_results) / len(dose_results)
-        avg_duration = sum(r.total_duration_seconds for r in dose_results) / len(dose_results)
-
+    dose_stats = stats.get(SessionType.DOSE)
+    if dose_stats and dose_stats.completed_count:
+        count = dose_stats.completed_count
         dose_metrics = {
-            "average_items_administered": avg_items,
-            "average_item_reduction_rate": avg_reduction,
-            "average_duration_seconds": avg_duration,
-            "total_sessions": len(dose_results),
+            "average_items_administered": dose_stats.sum_items_administered / count,
+            "average_item_reduction_rate": dose_stats.sum_item_reduction_rate / count,
+            "average_duration_seconds": dose_stats.sum_duration_seconds / count,
+            "total_sessions": count,
         }
 
     return {
-        "total_participants": len(participants),
+        "total_participants": total_participants,
         "sessions_completed": session_counts,
         "dose_efficiency_metrics": dose_metrics,
     }
+
+
+@router.get("/aggregate")
+async def get_aggregate_results(
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get aggregate results across all participants (admin/research endpoint).
+
+    Served from a short-lived per-worker cache; if recomputing fails, the
+    last computed results are returned instead of an error.
+    """
+    now = time.monotonic()
+    if now < _aggregate_cache["expires_at"]:
+        return ORJSONResponse(_aggregate_cache["payload"])
+
+    try:
+        payload = await _compute_aggregate_results(db)
+    except SQLAlchemyError:
+        if _aggregate_cache["payload"] is None:
+            raise
+        logger.warning(
+            "Recomputing aggregate results failed; serving cached results",
+            exc_info=True,
+        )
+        return ORJSONResponse(_aggregate_cache["payload"])
+
+    _aggregate_cache["payload"] = payload
+    _aggregate_cache["expires_at"] = now + settings.AGGREGATE_CACHE_SECONDS
+    return ORJSONResponse(payload)
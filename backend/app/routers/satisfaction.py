@@ -1,7 +1,7 @@
 """Satisfaction survey API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, literal, bindparam
 
 from ..core.database import get_db
 from ..models import Participant, SatisfactionSurvey
@@ -9,6 +9,11 @@ from ..schemas import SatisfactionSubmit, SatisfactionResponse, SatisfactionStat
 
 router = APIRouter()
 
+# Lookup statements built once at import, executed with bound parameters
+_PARTICIPANT_BY_ID = select(Participant).where(
+    Participant.id == bindparam("participant_id")
+)
+
 
 @router.post("/{participant_id}/submit", response_model=SatisfactionResponse, status_code=status.HTTP_201_CREATED)
 async def submit_satisfaction_survey(
@@ -23,7 +28,7 @@ async def submit_satisfaction_survey(
     """
     # Verify participant exists
     result = await db.execute(
-        select(Participant).where(Participant.id == participant_id)
+        _PARTICIPANT_BY_ID, {"participant_id": participant_id}
     )
     participant = result.scalar_one_or_none()
 
@@ -33,11 +38,12 @@ async def submit_satisfaction_survey(
             detail="Participant not found"
         )
 
-    # Check if already submitted
-    result = await db.execute(
-        select(SatisfactionSurvey).where(SatisfactionSurvey.participant_id == participant_id)
+    # Check if already submitted (presence only, no ORM object)
+    existing = await db.scalar(
+        select(literal(1))
+        .where(SatisfactionSurvey.participant_id == participant_id)
+        .limit(1)
     )
-    existing = result.scalar_one_or_none()
 
     if existing:
         raise HTTPException(
@@ -58,7 +64,6 @@ async def submit_satisfaction_survey(
 
     db.add(survey)
     await db.commit()
-    await db.refresh(survey)
 
     return survey
 
@@ -73,7 +78,7 @@ async def get_satisfaction_status(
     """
     # Verify participant exists
     result = await db.execute(
-        select(Participant).where(Participant.id == participant_id)
+        _PARTICIPANT_BY_ID, {"participant_id": participant_id}
     )
     participant = result.scalar_one_or_none()
 
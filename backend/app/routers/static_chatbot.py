@@ -1,11 +1,11 @@
 """G2: Static Chatbot API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, literal, bindparam
 from datetime import datetime
 
 from ..core.database import get_db
-from ..core.mini_ipip6_data import MINI_IPIP6_ITEMS, SURVEY_ORDER
+from ..core.mini_ipip6_data import SURVEY_ORDER_ITEMS
 from ..models import (
     Participant, AssessmentSession, SessionType, SessionStatus,
     ItemResponse, AssessmentResult
@@ -18,6 +18,11 @@ from ..services.counterbalancing import get_sequence_number
 
 router = APIRouter()
 
+# Lookup statements built once at import, executed with bound parameters
+_SESSION_BY_ID = select(AssessmentSession).where(
+    AssessmentSession.id == bindparam("session_id")
+)
+
 
 @router.post("/{participant_id}/start", response_model=StaticStartResponse)
 async def start_static_chatbot(
@@ -37,14 +42,15 @@ async def start_static_chatbot(
             detail="Participant not found"
         )
 
-    # Check if static chatbot already completed
-    result = await db.execute(
-        select(AssessmentSession)
+    # Check if static chatbot already completed (presence only, no ORM object)
+    already_completed = await db.scalar(
+        select(literal(1))
         .where(AssessmentSession.participant_id == participant_id)
         .where(AssessmentSession.session_type == SessionType.STATIC)
         .where(AssessmentSession.status == SessionStatus.COMPLETED)
+        .limit(1)
     )
-    if result.scalar_one_or_none():
+    if already_completed:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Static chatbot already completed for this participant"
@@ -64,17 +70,15 @@ async def start_static_chatbot(
 
     db.add(session)
     await db.commit()
-    await db.refresh(session)
 
     # Get first item
-    first_item_num = SURVEY_ORDER[0]
-    first_item = MINI_IPIP6_ITEMS[first_item_num]
+    _, first_item_text, _ = SURVEY_ORDER_ITEMS[0]
 
     return StaticStartResponse(
         session_id=session.id,
         message="Hi! I'm going to ask you some questions about yourself. Please rate how accurately each statement describes you on a scale from 1 (Very Inaccurate) to 7 (Very Accurate).",
         current_item=1,
-        item_text=first_item["text"],
+        item_text=first_item_text,
         total_items=24,
     )
 
@@ -88,7 +92,7 @@ async def respond_static_chatbot(
     """Submit a response to the current item in static chatbot."""
     # Verify session exists
     result = await db.execute(
-        select(AssessmentSession).where(AssessmentSession.id == session_id)
+        _SESSION_BY_ID, {"session_id": session_id}
     )
     session = result.scalar_one_or_none()
 
@@ -119,14 +123,13 @@ async def respond_static_chatbot(
         )
 
     # Get current item
-    current_item_num = SURVEY_ORDER[current_idx]
-    current_item = MINI_IPIP6_ITEMS[current_item_num]
+    current_item_num, _, current_item_trait = SURVEY_ORDER_ITEMS[current_idx]
 
     # Save response
     response = ItemResponse(
         session_id=session_id,
         item_number=current_item_num,
-        trait=current_item["trait"],
+        trait=current_item_trait,
         response_value=data.response_value,
         presentation_order=current_idx + 1,
     )
@@ -139,39 +142,41 @@ async def respond_static_chatbot(
     is_complete = session.items_administered >= 24
 
     if is_complete:
-        # Get all responses for scoring
+        # Get the earlier responses as (item_number, value) rows, no ORM
+        # objects or ordering needed (scoring keys by item number). The
+        # current response is not flushed yet, so it is added exactly once.
         result = await db.execute(
-            select(ItemResponse)
+            select(ItemResponse.item_number, ItemResponse.response_value)
             .where(ItemResponse.session_id == session_id)
-            .order_by(ItemResponse.presentation_order)
         )
-        all_responses = result.scalars().all()
-        response_list = [(r.item_number, r.response_value) for r in all_responses]
+        response_list = result.all()
         response_list.append((current_item_num, data.response_value))
 
         # Calculate scores
         scores = calculate_all_scores_from_list(response_list)
 
-        # Calculate duration
-        duration = int((datetime.utcnow() - session.started_at).total_seconds())
-
-        # Create result
-        result_obj = AssessmentResult(
-            session_id=session_id,
-            extraversion_score=scores["extraversion"]["score"],
-            agreeableness_score=scores["agreeableness"]["score"],
-            conscientiousness_score=scores["conscientiousness"]["score"],
-            neuroticism_score=scores["neuroticism"]["score"],
-            openness_score=scores["openness"]["score"],
-            honesty_humility_score=scores["honesty_humility"]["score"],
-            total_items_administered=24,
-            total_duration_seconds=duration,
+        # Calculate duration (one clock read, so it matches completed_at)
+        completed_at = datetime.utcnow()
+        duration = int((completed_at - session.started_at).total_seconds())
+
+        # Create result (Core insert, no ORM object)
+        await db.execute(
+            insert(AssessmentResult).values(
+                session_id=session_id,
+                extraversion_score=scores["extraversion"]["score"],
+                agreeableness_score=scores["agreeableness"]["score"],
+                conscientiousness_score=scores["conscientiousness"]["score"],
+                neuroticism_score=scores["neuroticism"]["score"],
+                openness_score=scores["openness"]["score"],
+                honesty_humility_score=scores["honesty_humility"]["score"],
+                total_items_administered=24,
+                total_duration_seconds=duration,
+            )
         )
-        db.add(result_obj)
 
         # Update session
         session.status = SessionStatus.COMPLETED
-        session.completed_at = datetime.utcnow()
+        session.completed_at = completed_at
         session.duration_seconds = duration
 
         await db.commit()
@@ -187,8 +192,7 @@ async def respond_static_chatbot(
     else:
         # Get next item
         next_idx = session.items_administered
-        next_item_num = SURVEY_ORDER[next_idx]
-        next_item = MINI_IPIP6_ITEMS[next_item_num]
+        next_item_num, next_item_text, _ = SURVEY_ORDER_ITEMS[next_idx]
 
         await db.commit()
 
@@ -196,7 +200,7 @@ async def respond_static_chatbot(
             session_id=session_id,
             is_complete=False,
             next_item_number=next_item_num,
-            next_item_text=next_item["text"],
+            next_item_text=next_item_text,
             progress=f"{session.items_administered}/24",
             message=None,
         )
@@ -209,7 +213,7 @@ async def get_static_state(
 ):
     """Get current state of static chatbot session."""
     result = await db.execute(
-        select(AssessmentSession).where(AssessmentSession.id == session_id)
+        _SESSION_BY_ID, {"session_id": session_id}
     )
     session = result.scalar_one_or_none()
 
@@ -222,12 +226,8 @@ async def get_static_state(
     # Get current item if not complete
     current_item = None
     if session.items_administered < 24:
-        current_item_num = SURVEY_ORDER[session.items_administered]
-        current_item = {
-            "number": current_item_num,
-            "text": MINI_IPIP6_ITEMS[current_item_num]["text"],
-            "trait": MINI_IPIP6_ITEMS[current_item_num]["trait"],
-        }
+        number, text, trait = SURVEY_ORDER_ITEMS[session.items_administered]
+        current_item = {"number": number, "text": text, "trait": trait}
 
     return {
         "session_id": session_id,
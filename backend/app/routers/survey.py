@@ -1,11 +1,12 @@
 """G1: Traditional Survey API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, and_, bindparam
 from datetime import datetime
 
 from ..core.database import get_db
-from ..core.mini_ipip6_data import MINI_IPIP6_ITEMS, SURVEY_ORDER
+from ..core.responses import ORJSONResponse
+from ..core.mini_ipip6_data import SURVEY_ORDER_ITEMS, get_item_trait
 from ..models import (
     Participant, AssessmentSession, SessionType, SessionStatus,
     ItemResponse, AssessmentResult
@@ -15,36 +16,65 @@ from ..schemas import (
 )
 from ..services.scoring_service import calculate_all_trait_scores, validate_complete_responses
 from ..services.counterbalancing import get_sequence_number
+from ..services.session_stats import record_session_completion
+from ..utils import new_ids
 
 router = APIRouter()
 
+# Lookup statements built once at import, executed with bound parameters
+_SESSION_BY_ID = select(AssessmentSession).where(
+    AssessmentSession.id == bindparam("session_id")
+)
+
+# Participant plus the id of a completed survey session, if any (one
+# round trip for both start checks), executed with bound parameters
+_PARTICIPANT_WITH_COMPLETED_SURVEY = (
+    select(Participant, AssessmentSession.id)
+    .outerjoin(
+        AssessmentSession,
+        and_(
+            AssessmentSession.participant_id == Participant.id,
+            AssessmentSession.session_type == SessionType.SURVEY,
+            AssessmentSession.status == SessionStatus.COMPLETED,
+        )
+    )
+    .where(Participant.id == bindparam("participant_id"))
+    .limit(1)
+)
 
-@router.post("/{participant_id}/start", response_model=SessionResponse)
+# Survey items in presentation order; static, so built (and validated) once
+_SURVEY_ITEMS = [
+    SurveyItem(item_number=num, text=text, trait=trait)
+    for num, text, trait in SURVEY_ORDER_ITEMS
+]
+
+
+@router.post(
+    "/{participant_id}/start",
+    response_model=None,
+    responses={200: {"model": SessionResponse}},
+)
 async def start_survey(
     participant_id: str,
     db: AsyncSession = Depends(get_db)
 ):
     """Start a new survey session for a participant."""
-    # Verify participant exists
+    # Fetch participant and any completed survey session in one round trip
     result = await db.execute(
-        select(Participant).where(Participant.id == participant_id)
+        _PARTICIPANT_WITH_COMPLETED_SURVEY, {"participant_id": participant_id}
     )
-    participant = result.scalar_one_or_none()
+    row = result.first()
 
-    if not participant:
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Participant not found"
         )
 
+    participant, completed_session_id = row
+
     # Check if survey already completed
-    result = await db.execute(
-        select(AssessmentSession)
-        .where(AssessmentSession.participant_id == participant_id)
-        .where(AssessmentSession.session_type == SessionType.SURVEY)
-        .where(AssessmentSession.status == SessionStatus.COMPLETED)
-    )
-    if result.scalar_one_or_none():
+    if completed_session_id is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Survey already completed for this participant"
@@ -63,9 +93,17 @@ async def start_survey(
 
     db.add(session)
     await db.commit()
-    await db.refresh(session)
 
-    return session
+    # Rendered directly by orjson; SessionResponse documents the shape
+    return ORJSONResponse({
+        "id": session.id,
+        "participant_id": session.participant_id,
+        "session_type": session.session_type.value,
+        "sequence_number": session.sequence_number,
+        "status": session.status.value,
+        "started_at": session.started_at,
+        "items_administered": session.items_administered,
+    })
 
 
 @router.get("/{session_id}/items", response_model=SurveyItemsResponse)
@@ -76,7 +114,7 @@ async def get_survey_items(
     """Get all survey items for a session."""
     # Verify session exists and is survey type
     result = await db.execute(
-        select(AssessmentSession).where(AssessmentSession.id == session_id)
+        _SESSION_BY_ID, {"session_id": session_id}
     )
     session = result.scalar_one_or_none()
 
@@ -92,20 +130,11 @@ async def get_survey_items(
             detail="Session is not a survey type"
         )
 
-    # Build items list
-    items = [
-        SurveyItem(
-            item_number=num,
-            text=MINI_IPIP6_ITEMS[num]["text"],
-            trait=MINI_IPIP6_ITEMS[num]["trait"],
-        )
-        for num in SURVEY_ORDER
-    ]
-
-    return SurveyItemsResponse(
+    # Items are prebuilt; skip re-validating them per request
+    return SurveyItemsResponse.model_construct(
         session_id=session_id,
-        items=items,
-        total_items=24,
+        items=_SURVEY_ITEMS,
+        total_items=len(_SURVEY_ITEMS),
     )
 
 
@@ -118,7 +147,7 @@ async def submit_survey(
     """Submit all survey responses and complete the session."""
     # Verify session exists
     result = await db.execute(
-        select(AssessmentSession).where(AssessmentSession.id == session_id)
+        _SESSION_BY_ID, {"session_id": session_id}
     )
     session = result.scalar_one_or_none()
 
@@ -150,48 +179,58 @@ async def submit_survey(
             detail=f"Invalid responses: missing={validation['missing_items']}, invalid={validation['invalid_values']}"
         )
 
-    # Save all responses
-    for idx, response_data in enumerate(data.responses):
-        item = MINI_IPIP6_ITEMS[response_data.item_number]
-        response = ItemResponse(
-            session_id=session_id,
-            item_number=response_data.item_number,
-            trait=item["trait"],
-            response_value=response_data.value,
-            presentation_order=idx + 1,
-        )
-        db.add(response)
+    # Save all responses in one bulk insert
+    await db.execute(
+        insert(ItemResponse),
+        [
+            {
+                "id": response_id,
+                "session_id": session_id,
+                "item_number": response_data.item_number,
+                "trait": get_item_trait(response_data.item_number),
+                "response_value": response_data.value,
+                "presentation_order": idx + 1,
+            }
+            for idx, (response_id, response_data) in enumerate(
+                zip(new_ids(len(data.responses)), data.responses)
+            )
+        ],
+    )
 
     # Calculate scores
     scores = calculate_all_trait_scores(responses_dict)
 
-    # Calculate duration
-    duration = int((datetime.utcnow() - session.started_at).total_seconds())
+    # Calculate duration (one clock read, so it matches completed_at)
+    completed_at = datetime.utcnow()
+    duration = int((completed_at - session.started_at).total_seconds())
 
-    # Create result
-    result_obj = AssessmentResult(
-        session_id=session_id,
-        extraversion_score=scores["extraversion"]["score"],
-        agreeableness_score=scores["agreeableness"]["score"],
-        conscientiousness_score=scores["conscientiousness"]["score"],
-        neuroticism_score=scores["neuroticism"]["score"],
-        openness_score=scores["openness"]["score"],
-        honesty_humility_score=scores["honesty_humility"]["score"],
-        total_items_administered=24,
-        total_duration_seconds=duration,
+    # Create result (Core insert, no ORM object)
+    await db.execute(
+        insert(AssessmentResult).values(
+            session_id=session_id,
+            extraversion_score=scores["extraversion"]["score"],
+            agreeableness_score=scores["agreeableness"]["score"],
+            conscientiousness_score=scores["conscientiousness"]["score"],
+            neuroticism_score=scores["neuroticism"]["score"],
+            openness_score=scores["openness"]["score"],
+            honesty_humility_score=scores["honesty_humility"]["score"],
+            total_items_administered=24,
+            total_duration_seconds=duration,
+        )
     )
-    db.add(result_obj)
 
     # Update session status
     session.status = SessionStatus.COMPLETED
-    session.completed_at = datetime.utcnow()
+    session.completed_at = completed_at
     session.duration_seconds = duration
     session.items_administered = 24
 
+    # Add to the running aggregate totals
+    await record_session_completion(db, SessionType.SURVEY, 24, duration)
+
     await db.commit()
-    await db.refresh(result_obj)
 
-    return {
+    return ORJSONResponse({
         "session_id": session_id,
         "status": "completed",
         "scores": {
@@ -199,4 +238,4 @@ async def submit_survey(
             for trait, data in scores.items()
         },
         "duration_seconds": duration,
-    }
+    })
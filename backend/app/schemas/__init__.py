@@ -15,6 +15,7 @@ from .assessment import (
     StaticRespond,
     StaticRespondResponse,
     TraitEstimate,
+    DOSEItem,
     DOSEStartResponse,
     DOSERespond,
     DOSEProgress,
@@ -25,6 +26,7 @@ from .assessment import (
     TraitInference,
     NaturalAnalyzeResponse,
     TraitScore,
+    SessionMetrics,
     SessionResult,
     ComparisonResult,
     ParticipantResults,
@@ -49,6 +51,7 @@ __all__ = [
     "StaticRespond",
     "StaticRespondResponse",
     "TraitEstimate",
+    "DOSEItem",
     "DOSEStartResponse",
     "DOSERespond",
     "DOSEProgress",
@@ -59,6 +62,7 @@ __all__ = [
     "TraitInference",
     "NaturalAnalyzeResponse",
     "TraitScore",
+    "SessionMetrics",
     "SessionResult",
     "ComparisonResult",
     "ParticipantResults",
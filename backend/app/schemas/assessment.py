@@ -1,6 +1,6 @@
 """Pydantic schemas for assessment endpoints."""
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Dict
 from datetime import datetime
 
 
@@ -83,17 +83,28 @@ class StaticRespondResponse(BaseModel):
 
 class TraitEstimate(BaseModel):
     """Schema for a single trait estimate."""
+    model_config = ConfigDict(frozen=True)
+
     theta: float
     se: float
     items_administered: int
     completed: bool = False
 
 
+class DOSEItem(BaseModel):
+    """Schema for an item presented by the DOSE chatbot."""
+    model_config = ConfigDict(frozen=True)
+
+    number: int
+    text: str
+    trait: str
+
+
 class DOSEStartResponse(BaseModel):
     """Schema for starting DOSE chatbot."""
     session_id: str
     message: str
-    current_item: Dict[str, Any]  # {number, text, trait}
+    current_item: DOSEItem
     current_estimates: Dict[str, TraitEstimate]
 
 
@@ -113,7 +124,7 @@ class DOSERespondResponse(BaseModel):
     """Schema for DOSE response result."""
     session_id: str
     action: str  # "present_item" or "complete"
-    next_item: Optional[Dict[str, Any]] = None
+    next_item: Optional[DOSEItem] = None
     current_estimates: Dict[str, TraitEstimate]
     progress: DOSEProgress
     stopping_reason: Optional[str] = None
@@ -143,6 +154,8 @@ class NaturalMessageResponse(BaseModel):
 
 class TraitInference(BaseModel):
     """Schema for inferred trait."""
+    model_config = ConfigDict(frozen=True)
+
     score: float
     confidence: str  # "high", "medium", "low"
     evidence: str
@@ -160,16 +173,26 @@ class NaturalAnalyzeResponse(BaseModel):
 
 class TraitScore(BaseModel):
     """Schema for a trait score."""
+    model_config = ConfigDict(frozen=True)
+
     score: float
     standard_error: Optional[float] = None
 
 
+class SessionMetrics(BaseModel):
+    """Schema for session efficiency metrics."""
+    total_items: int
+    duration_seconds: int
+    item_reduction_rate: Optional[float] = None  # DOSE only
+    conversation_turns: Optional[int] = None  # Natural chatbot only
+
+
 class SessionResult(BaseModel):
     """Schema for session results."""
     session_id: str
     session_type: str
     scores: Dict[str, TraitScore]
-    metrics: Dict[str, Any]
+    metrics: SessionMetrics
     completed_at: Optional[datetime] = None
 
 
@@ -9,16 +9,18 @@ Posterior: Updated using Bayes' theorem after each response
 """
 
 import numpy as np
-from scipy.stats import norm
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, field
 
 from .irt_engine import IRTEngine, irt_engine
-from ..core.mini_ipip6_data import MINI_IPIP6_ITEMS, TRAITS
+from ..core.mini_ipip6_data import TRAITS, ALPHA, BETA, REVERSED
 
 # NumPy 2.0 compatibility: trapz was renamed to trapezoid
 _trapz = np.trapezoid if hasattr(np, 'trapezoid') else np.trapz
 
+# log(sqrt(2 * pi)), for the closed-form normal prior
+_LOG_SQRT_2PI = 0.5 * np.log(2.0 * np.pi)
+
 
 @dataclass
 class TraitState:
@@ -31,6 +33,9 @@ class TraitState:
     responses: List[Tuple[int, int]] = field(default_factory=list)  # (item_number, response)
     items_used: List[int] = field(default_factory=list)
     total_information: float = 0.0
+    # Unnormalized log posterior on the updater's grid for `responses`;
+    # a per-process cache, not serialized (None until the next update)
+    log_posterior_grid: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
@@ -95,6 +100,46 @@ class BayesianUpdater:
         self.theta_grid = np.linspace(theta_min, theta_max, grid_points)
         self.theta_step = self.theta_grid[1] - self.theta_grid[0]
 
+        # Prior evaluated once on the grid (read-only, shared by every
+        # posterior computation)
+        self.log_prior_grid = self.log_prior(self.theta_grid)
+        self.log_prior_grid.flags.writeable = False
+
+        # Prior density normalized on the grid (fallback posterior)
+        prior_grid = np.exp(self.log_prior_grid)
+        self.prior_grid = prior_grid / _trapz(prior_grid, self.theta_grid)
+        self.prior_grid.flags.writeable = False
+
+        # Log-likelihood of every (item, response) pair on the grid, with
+        # reverse scoring applied: shape (25, 7, grid_points), indexed by
+        # item number and response - 1 (row 0 unused). The grid is fixed,
+        # so posteriors reduce to gathering and summing rows of this table.
+        self.log_likelihood_table = self._build_log_likelihood_table()
+        self.log_likelihood_table.flags.writeable = False
+
+    def _build_log_likelihood_table(self) -> np.ndarray:
+        """
+        Evaluate the log-likelihood of every item and response on the grid.
+
+        Returns:
+            Array of shape (25, 7, grid_points); item 0 is all zeros
+        """
+        n_items = len(ALPHA)
+        item_nums = np.repeat(np.arange(1, n_items), 7)
+        responses = np.tile(np.arange(1, 8), n_items - 1)
+
+        # Handle reverse scoring for likelihood calculation
+        effective = np.where(REVERSED[item_nums], 8 - responses, responses)
+
+        table = np.zeros((n_items, 7, len(self.theta_grid)))
+        table[1:] = self.irt.log_likelihood_vec(
+            effective,
+            self.theta_grid,
+            ALPHA[item_nums],
+            BETA[item_nums]
+        ).reshape(n_items - 1, 7, -1)
+        return table
+
     def initialize_trait_states(self) -> Dict[str, TraitState]:
         """
         Initialize state for all traits with N(0,1) prior.
@@ -118,24 +163,27 @@ class BayesianUpdater:
         Calculate prior density at theta.
 
         Args:
-            theta: Trait level
+            theta: Trait level (scalar or array)
 
         Returns:
             Prior density value
         """
-        return norm.pdf(theta, loc=self.prior_mean, scale=self.prior_sd)
+        return np.exp(self.log_prior(theta))
 
     def log_prior(self, theta: float) -> float:
         """
         Calculate log prior density.
 
         Args:
-            theta: Trait level
+            theta: Trait level (scalar or array)
 
         Returns:
             Log prior density
         """
-        return norm.logpdf(theta, loc=self.prior_mean, scale=self.prior_sd)
+        # Closed form of scipy.stats.norm.logpdf; avoids importing scipy.stats
+        # (the single largest import on the API's startup path)
+        z = (theta - self.prior_mean) / self.prior_sd
+        return -0.5 * z * z - _LOG_SQRT_2PI - np.log(self.prior_sd)
 
     def compute_posterior(
         self,
@@ -155,36 +203,46 @@ class BayesianUpdater:
         Returns:
             Tuple of (posterior_density_array, posterior_mean, posterior_sd)
         """
-        # Initialize log posterior with log prior
-        log_posterior = np.zeros_like(self.theta_grid)
+        return self._posterior_moments(self.log_posterior(responses))
+
+    def log_posterior(self, responses: List[Tuple[int, int]]) -> np.ndarray:
+        """
+        Compute the unnormalized log posterior over the theta grid.
+
+        Args:
+            responses: List of (item_number, response_value) tuples
 
-        for theta_idx, theta in enumerate(self.theta_grid):
-            # Log prior
-            log_prior = self.log_prior(theta)
+        Returns:
+            Log prior plus summed log-likelihoods, one value per grid point
+        """
+        # Start from the precomputed log prior over the grid
+        log_posterior = self.log_prior_grid
 
-            # Log likelihood (sum over all responses)
-            log_lik = 0.0
-            for item_num, response in responses:
-                item = MINI_IPIP6_ITEMS[item_num]
+        # Log likelihood summed over all responses (precomputed rows)
+        if responses:
+            item_nums, values = np.asarray(responses, dtype=np.intp).T
+            log_posterior = log_posterior + self.log_likelihood_table[
+                item_nums, values - 1
+            ].sum(axis=0)
 
-                # Handle reverse scoring for likelihood calculation
-                effective_response = response
-                if item["reverse_scored"]:
-                    effective_response = 8 - response
+        return log_posterior
 
-                log_lik += self.irt.log_likelihood(
-                    effective_response,
-                    theta,
-                    item["alpha"],
-                    item["beta"]
-                )
+    def _posterior_moments(
+        self,
+        log_posterior: np.ndarray
+    ) -> Tuple[np.ndarray, float, float]:
+        """
+        Normalize a log posterior and compute its mean and SD.
 
-            log_posterior[theta_idx] = log_prior + log_lik
+        Args:
+            log_posterior: Unnormalized log posterior over the theta grid
 
+        Returns:
+            Tuple of (posterior_density_array, posterior_mean, posterior_sd)
+        """
         # Convert from log scale and normalize
         # Subtract max for numerical stability before exponentiating
-        log_posterior -= log_posterior.max()
-        posterior = np.exp(log_posterior)
+        posterior = np.exp(log_posterior - log_posterior.max())
 
         # Normalize using trapezoidal integration
         normalizing_constant = _trapz(posterior, self.theta_grid)
@@ -192,10 +250,7 @@ class BayesianUpdater:
             posterior = posterior / normalizing_constant
         else:
             # Fallback to prior if posterior computation fails
-            posterior = np.array([
-                self.prior_density(theta) for theta in self.theta_grid
-            ])
-            posterior = posterior / _trapz(posterior, self.theta_grid)
+            posterior = self.prior_grid.copy()
 
         # Compute posterior mean
         posterior_mean = _trapz(posterior * self.theta_grid, self.theta_grid)
@@ -230,10 +285,11 @@ class BayesianUpdater:
         trait_state.responses.append((item_number, response))
         trait_state.items_used.append(item_number)
 
-        # Compute new posterior
-        posterior, post_mean, post_sd = self.compute_posterior(
-            trait_state.responses,
-            trait_state.trait
+        # Compute new posterior (kept unnormalized on the state so item
+        # selection can extend it by one response)
+        trait_state.log_posterior_grid = self.log_posterior(trait_state.responses)
+        posterior, post_mean, post_sd = self._posterior_moments(
+            trait_state.log_posterior_grid
         )
 
         # Update state
@@ -269,35 +325,34 @@ class BayesianUpdater:
         Returns:
             Expected posterior variance
         """
-        item = MINI_IPIP6_ITEMS[candidate_item]
-        current_theta = trait_state.theta_estimate
-
-        epv = 0.0
-
-        # Consider all possible responses (1-7)
-        for response in range(1, 8):
-            # Probability of this response given current theta
-            effective_response = response
-            if item["reverse_scored"]:
-                effective_response = 8 - response
-
-            p_response = self.irt.likelihood(
-                effective_response,
-                current_theta,
-                item["alpha"],
-                item["beta"]
-            )
-
-            # Hypothetical posterior if we observe this response
-            hypothetical_responses = trait_state.responses + [(candidate_item, response)]
-            _, _, hyp_sd = self.compute_posterior(
-                hypothetical_responses,
-                trait_state.trait
-            )
-
-            epv += p_response * (hyp_sd ** 2)
+        alpha, betas = ALPHA[candidate_item], BETA[candidate_item]
+
+        # Effective (reverse-scored if needed) value of each response 1-7
+        responses = np.arange(1, 8)
+        effective = 8 - responses if REVERSED[candidate_item] else responses
+
+        # Probability of each response given current theta
+        p_response = self.irt.category_probabilities(
+            trait_state.theta_estimate, alpha, betas
+        )[effective - 1]
+
+        # Hypothetical posteriors for all 7 responses at once: the current
+        # log posterior plus the candidate item's log-likelihood
+        log_posterior = trait_state.log_posterior_grid
+        if log_posterior is None:
+            log_posterior = self.log_posterior(trait_state.responses)
+        hypothetical = log_posterior + self.log_likelihood_table[candidate_item]
+
+        posterior = np.exp(hypothetical - hypothetical.max(axis=1, keepdims=True))
+        posterior /= _trapz(posterior, self.theta_grid, axis=1)[:, None]
+        hyp_mean = _trapz(posterior * self.theta_grid, self.theta_grid, axis=1)
+        hyp_var = _trapz(
+            posterior * (self.theta_grid - hyp_mean[:, None]) ** 2,
+            self.theta_grid,
+            axis=1
+        )
 
-        return epv
+        return float(np.dot(p_response, np.maximum(hyp_var, 1e-10)))
 
     def compute_standard_error(self, trait_state: TraitState) -> float:
         """
@@ -5,12 +5,42 @@ Implements random order assignment between Survey and DOSE conditions
 to prevent systematic order effects.
 """
 
-import random
+import secrets
 from typing import Dict, List, Optional
 
+import numpy as np
+
 # Two assessment conditions
 CONDITIONS = ["survey", "dose"]
 
+# Condition order for each latin_square_row (0: survey-first, 1: dose-first)
+CONDITION_ORDERS = (
+    ("survey", "dose"),
+    ("dose", "survey"),
+)
+
+# Condition indices for each latin_square_row
+CONDITION_SEQUENCES = (
+    (0, 1),
+    (1, 0),
+)
+
+# Sequence number (1-indexed) of each condition, per condition order
+_SEQUENCE_NUMBERS = {
+    order: {condition: i + 1 for i, condition in enumerate(order)}
+    for order in CONDITION_ORDERS
+}
+
+# Next condition per (condition order, set of completed conditions)
+_NEXT_CONDITIONS = {
+    (order, frozenset(done)): next((c for c in order if c not in done), None)
+    for order in CONDITION_ORDERS
+    for done in ((), order[:1], order[1:], order)
+}
+
+# Generator for order assignment, seeded from the OS entropy pool
+_RNG = np.random.default_rng(secrets.randbits(128))
+
 
 def get_condition_name(index: int) -> str:
     """Get condition name from index."""
@@ -37,13 +67,10 @@ def assign_condition_order(participant_number: int) -> Dict:
         - condition_sequence: List of condition indices
         - condition_order: List of condition names in order
     """
-    # Randomly decide order
-    order = CONDITIONS.copy()
-    random.shuffle(order)
-
-    # Determine row index based on which comes first
-    row_index = 0 if order[0] == "survey" else 1
-    sequence = [CONDITIONS.index(c) for c in order]
+    # Randomly pick the row; order and sequence follow from it
+    row_index = int(_RNG.integers(len(CONDITION_ORDERS)))
+    order = list(CONDITION_ORDERS[row_index])
+    sequence = list(CONDITION_SEQUENCES[row_index])
 
     return {
         "latin_square_row": row_index,
@@ -66,6 +93,11 @@ def get_next_condition(
     Returns:
         Next condition name, or None if all completed
     """
+    key = (tuple(condition_order), frozenset(completed_conditions))
+    if key in _NEXT_CONDITIONS:
+        return _NEXT_CONDITIONS[key]
+
+    # Orders or completions outside the design: scan
     for condition in condition_order:
         if condition not in completed_conditions:
             return condition
@@ -86,6 +118,11 @@ def get_sequence_number(
     Returns:
         Sequence number (1-indexed)
     """
+    positions = _SEQUENCE_NUMBERS.get(tuple(condition_order))
+    if positions is not None and condition in positions:
+        return positions[condition]
+
+    # Orders or conditions outside the design (raises ValueError if absent)
     return condition_order.index(condition) + 1
 
 
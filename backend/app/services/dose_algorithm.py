@@ -18,6 +18,8 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+
 from .irt_engine import IRTEngine, irt_engine
 from .bayesian_updater import BayesianUpdater, TraitState, bayesian_updater
 from ..core.mini_ipip6_data import (
@@ -53,8 +55,18 @@ class DOSESessionState:
     trait_states: Dict[str, TraitState]
     administered_items: List[ItemHistory] = field(default_factory=list)
     traits_completed: Dict[str, bool] = field(default_factory=dict)
+    # Number of True entries in traits_completed (see mark_trait_completed)
+    n_traits_completed: int = 0
     total_items: int = 0
     current_trait_index: int = 0
+    # Item last presented by get_next_action and awaiting a response
+    pending_item_number: Optional[int] = None
+
+    def mark_trait_completed(self, trait: str) -> None:
+        """Mark a trait as completed, keeping n_traits_completed in sync."""
+        if not self.traits_completed[trait]:
+            self.traits_completed[trait] = True
+            self.n_traits_completed += 1
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
@@ -64,8 +76,10 @@ class DOSESessionState:
                 for trait, state in self.trait_states.items()
             },
             "traits_completed": self.traits_completed,
+            "n_traits_completed": self.n_traits_completed,
             "total_items": self.total_items,
             "current_trait_index": self.current_trait_index,
+            "pending_item_number": self.pending_item_number,
             "administered_items": [
                 {
                     "item_number": h.item_number,
@@ -109,8 +123,12 @@ class DOSESessionState:
             trait_states=trait_states,
             administered_items=administered_items,
             traits_completed=data["traits_completed"],
+            n_traits_completed=data.get(
+                "n_traits_completed", sum(data["traits_completed"].values())
+            ),
             total_items=data["total_items"],
             current_trait_index=data.get("current_trait_index", 0),
+            pending_item_number=data.get("pending_item_number"),
         )
 
 
@@ -203,15 +221,11 @@ class DOSEAlgorithm:
         if not available_items:
             return None
 
-        # Calculate Fisher Information for each available item
-        item_info = {}
-        for item_num in available_items:
-            info = self.irt.item_fisher_information(item_num, current_theta)
-            item_info[item_num] = info
+        # Fisher Information for all available items in one vectorized pass
+        item_info = self.irt.items_fisher_information(available_items, current_theta)
 
-        # Select item with maximum information
-        best_item = max(item_info, key=item_info.get)
-        return best_item
+        # Select item with maximum information (first one on ties)
+        return available_items[int(np.argmax(item_info))]
 
     def process_response(
         self,
@@ -267,7 +281,7 @@ class DOSEAlgorithm:
         # Check if trait has reached stopping criterion
         if (trait_state.standard_error < self.se_threshold or
                 len(trait_state.items_used) >= self.max_items_per_trait):
-            state.traits_completed[trait] = True
+            state.mark_trait_completed(trait)
 
         return state
 
@@ -275,13 +289,17 @@ class DOSEAlgorithm:
         """
         Determine the next action in the assessment.
 
+        The selected item is recorded as state.pending_item_number so the
+        response handler does not have to repeat the selection.
+
         Returns:
             Dictionary with action type and relevant data:
             - If complete: {"action": "complete", "current_estimates": {...}}
             - If present_item: {"action": "present_item", "item_number": ..., ...}
         """
         # Check if all traits are completed
-        if all(state.traits_completed.values()):
+        if state.n_traits_completed == len(state.traits_completed):
+            state.pending_item_number = None
             return {
                 "action": DOSEAction.COMPLETE,
                 "current_estimates": self._get_current_estimates(state),
@@ -304,9 +322,11 @@ class DOSEAlgorithm:
 
         if next_item is None:
             # No more items for this trait, mark as completed
-            state.traits_completed[next_trait] = True
+            state.mark_trait_completed(next_trait)
             return self.get_next_action(state)  # Recurse
 
+        state.pending_item_number = next_item
+
         # Get item data
         item_data = MINI_IPIP6_ITEMS[next_item]
         trait_state = state.trait_states[next_trait]
@@ -321,7 +341,7 @@ class DOSEAlgorithm:
             "current_estimates": self._get_current_estimates(state),
             "progress": {
                 "items_administered": state.total_items,
-                "traits_completed": sum(state.traits_completed.values()),
+                "traits_completed": state.n_traits_completed,
                 "total_traits": len(TRAITS),
             }
         }
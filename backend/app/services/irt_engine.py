@@ -11,8 +11,8 @@ Key formulas:
 """
 
 import numpy as np
-from typing import List, Tuple, Optional
-from ..core.mini_ipip6_data import MINI_IPIP6_ITEMS
+from typing import List, Sequence, Tuple, Optional
+from ..core.mini_ipip6_data import MINI_IPIP6_ITEMS, ALPHA, BETA
 
 
 class IRTEngine:
@@ -206,6 +206,46 @@ class IRTEngine:
         lik = self.likelihood(response, theta, alpha, betas)
         return np.log(max(lik, 1e-300))
 
+    def log_likelihood_vec(
+        self,
+        responses: np.ndarray,
+        theta: np.ndarray,
+        alpha: np.ndarray,
+        betas: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate log-likelihoods for several responses over a theta grid.
+
+        Vectorized form of log_likelihood (same clipping and normalization),
+        evaluated for every (response, theta) pair in one pass.
+
+        Args:
+            responses: Observed responses (1-7), shape (n,)
+            theta: Trait levels, shape (g,)
+            alpha: Item discriminations, shape (n,)
+            betas: Difficulty thresholds, shape (n, 6)
+
+        Returns:
+            Array of shape (n, g) of log-likelihood values
+        """
+        n = len(responses)
+        exponent = np.clip(
+            -alpha[:, None, None] * (theta[None, None, :] - betas[:, :, None]),
+            -700, 700
+        )
+
+        # Cumulative probabilities bracketed by P*=1 below and P*=0 above,
+        # so category k is the difference of adjacent entries
+        cumulative = np.empty((n, 8, len(theta)))
+        cumulative[:, 0] = 1.0
+        cumulative[:, 1:7] = 1.0 / (1.0 + np.exp(exponent))
+        cumulative[:, 7] = 0.0
+        probs = np.clip(cumulative[:, :-1] - cumulative[:, 1:], 1e-10, 1.0)
+
+        observed = probs[np.arange(n), np.asarray(responses) - 1]
+        lik = observed / probs.sum(axis=1)
+        return np.log(np.maximum(lik, 1e-300))
+
     def item_log_likelihood(
         self,
         item_number: int,
@@ -258,6 +298,43 @@ class IRTEngine:
         item = MINI_IPIP6_ITEMS[item_number]
         return self.fisher_information(theta, item["alpha"], item["beta"])
 
+    def fisher_information_all(self, theta: float) -> np.ndarray:
+        """
+        Calculate Fisher Information for every Mini-IPIP6 item at once.
+
+        Vectorized over the ALPHA/BETA parameter arrays.
+
+        Args:
+            theta: Current trait estimate
+
+        Returns:
+            Array of shape (25,) indexed by item number (index 0 is 0.0)
+        """
+        exponent = np.clip(-ALPHA[:, None] * (theta - BETA), -700, 700)
+        p_star = 1.0 / (1.0 + np.exp(exponent))
+        return ALPHA ** 2 * (p_star * (1.0 - p_star)).sum(axis=1)
+
+    def items_fisher_information(
+        self,
+        item_numbers: Sequence[int],
+        theta: float
+    ) -> np.ndarray:
+        """
+        Calculate Fisher Information for a subset of items in one pass.
+
+        Args:
+            item_numbers: Item numbers (1-24)
+            theta: Current trait estimate
+
+        Returns:
+            Array of Fisher Information values, aligned with item_numbers
+        """
+        idx = np.asarray(item_numbers, dtype=np.intp)
+        alpha = ALPHA[idx]
+        exponent = np.clip(-alpha[:, None] * (theta - BETA[idx]), -700, 700)
+        p_star = 1.0 / (1.0 + np.exp(exponent))
+        return alpha ** 2 * (p_star * (1.0 - p_star)).sum(axis=1)
+
     def total_information(
         self,
         item_numbers: List[int],
@@ -6,12 +6,14 @@ and trait inference from natural dialogue.
 """
 
 import json
-from typing import List, Dict, AsyncGenerator, Optional
-from openai import AsyncOpenAI
+from typing import List, Dict, AsyncGenerator, Optional, TYPE_CHECKING
 
 from ..config import settings
 from ..core.mini_ipip6_data import TRAITS, TRAIT_NAMES
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 
 # System prompt for natural conversation
 NATURAL_CONVERSATION_PROMPT = """You are a friendly and engaging conversational partner having a casual chat. Your goal is to get to know the person you're talking to through natural conversation, WITHOUT explicitly mentioning personality assessment or psychological evaluation.
@@ -90,17 +92,32 @@ class LLMService:
         """
         Initialize LLM service.
 
+        The API key and OpenAI client are resolved lazily on first use, so
+        workers that only serve survey/DOSE endpoints never import the
+        OpenAI SDK or read the key.
+
         Args:
             api_key: OpenAI API key (defaults to settings)
             model: Model to use (defaults to settings)
         """
-        self.api_key = api_key or settings.OPENAI_API_KEY
+        self._api_key = api_key
         self.model = model or settings.OPENAI_MODEL
-
-        if self.api_key:
-            self.client = AsyncOpenAI(api_key=self.api_key)
-        else:
-            self.client = None
+        self._client: Optional["AsyncOpenAI"] = None
+
+    @property
+    def api_key(self) -> Optional[str]:
+        """OpenAI API key, read from settings on first access."""
+        if self._api_key is None:
+            self._api_key = settings.OPENAI_API_KEY
+        return self._api_key
+
+    @property
+    def client(self) -> Optional["AsyncOpenAI"]:
+        """OpenAI client, created on first access if a key is configured."""
+        if self._client is None and self.api_key:
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI(api_key=self.api_key)
+        return self._client
 
     def is_configured(self) -> bool:
         """Check if LLM service is properly configured."""
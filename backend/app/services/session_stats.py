@@ -0,0 +1,64 @@
+"""
+Running per-session-type statistics.
+
+Completion handlers call record_session_completion inside their
+transaction; aggregate endpoints read the totals back in O(1).
+
+Totals are only ever incremented. After deleting sessions or results,
+rebuild session_type_stats with the backfill in DEPLOYMENT.md.
+"""
+
+from typing import Optional
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import SessionType, SessionTypeStats
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+async def record_session_completion(
+    db: AsyncSession,
+    session_type: SessionType,
+    items_administered: int,
+    duration_seconds: int,
+    item_reduction_rate: Optional[float] = None,
+) -> None:
+    """
+    Add a completed session to the running totals of its type.
+
+    Creates the type's row on first use; concurrent completions are safe
+    because the increment happens in the database.
+
+    Args:
+        db: Database session (not committed here)
+        session_type: Type of the completed session
+        items_administered: Items administered in the session
+        duration_seconds: Session duration
+        item_reduction_rate: DOSE item reduction rate (None counts as 0)
+    """
+    reduction = item_reduction_rate or 0.0
+    insert = _UPSERT_INSERTS[db.get_bind().dialect.name]
+    stmt = insert(SessionTypeStats).values(
+        session_type=session_type,
+        completed_count=1,
+        sum_items_administered=items_administered,
+        sum_duration_seconds=duration_seconds,
+        sum_item_reduction_rate=reduction,
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[SessionTypeStats.session_type],
+            set_={
+                "completed_count": SessionTypeStats.completed_count + 1,
+                "sum_items_administered": SessionTypeStats.sum_items_administered + items_administered,
+                "sum_duration_seconds": SessionTypeStats.sum_duration_seconds + duration_seconds,
+                "sum_item_reduction_rate": SessionTypeStats.sum_item_reduction_rate + reduction,
+            },
+        )
+    )
@@ -0,0 +1,11 @@
+"""Utility functions."""
+from .ids import uuid7, uuid7_batch, new_id, new_ids
+from .projection import make_dict_projector
+
+__all__ = [
+    "uuid7",
+    "uuid7_batch",
+    "new_id",
+    "new_ids",
+    "make_dict_projector",
+]
@@ -0,0 +1,72 @@
+"""Identifier generation helpers."""
+import os
+import time
+import uuid
+from typing import List
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits hold the Unix timestamp in milliseconds, so ids
+    generated later sort after earlier ones and primary-key inserts append
+    to the end of the index instead of landing on random pages.
+
+    Returns:
+        A new version 7 UUID
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = rand >> 68                    # 12 bits
+    rand_b = rand & ((1 << 62) - 1)        # 62 bits
+
+    value = (
+        (unix_ts_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76                        # version
+        | rand_a << 64
+        | 0b10 << 62                       # RFC 4122 variant
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+def uuid7_batch(n: int) -> List[uuid.UUID]:
+    """
+    Generate n version 7 UUIDs from one clock read and one urandom call.
+
+    All UUIDs share the same millisecond timestamp; the 12-bit rand_a field
+    carries the position in the batch (RFC 9562 counter method), so the
+    batch sorts in generation order.
+
+    Args:
+        n: Number of UUIDs (at most 4096)
+
+    Returns:
+        List of n version 7 UUIDs
+    """
+    if not 0 <= n <= 0x1000:
+        raise ValueError("uuid7_batch supports at most 4096 ids per call")
+
+    unix_ts_ms = time.time_ns() // 1_000_000
+    buf = os.urandom(8 * n)
+    prefix = (unix_ts_ms & 0xFFFFFFFFFFFF) << 80 | 0x7 << 76 | 0b10 << 62
+
+    return [
+        uuid.UUID(int=(
+            prefix
+            | i << 64
+            | int.from_bytes(buf[8 * i:8 * i + 8], "big") & ((1 << 62) - 1)
+        ))
+        for i in range(n)
+    ]
+
+
+def new_id() -> str:
+    """Generate a new primary key string (time-ordered UUID)."""
+    return str(uuid7())
+
+
+def new_ids(n: int) -> List[str]:
+    """Generate n primary key strings for a bulk insert."""
+    return [str(u) for u in uuid7_batch(n)]
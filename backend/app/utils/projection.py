@@ -0,0 +1,45 @@
+"""Generated dict projections for ORM models."""
+import functools
+from typing import Any, Callable, Dict, Tuple
+
+
+@functools.cache
+def make_dict_projector(
+    keys: Tuple[str, ...],
+    datetime_keys: Tuple[str, ...] = (),
+    enum_keys: Tuple[str, ...] = ()
+) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Build a to_dict() function for the given attribute names.
+
+    The function body is generated as a single dict literal, so each field
+    costs one attribute load instead of going through a generic loop.
+
+    Args:
+        keys: Attribute names, in output order (also used as dict keys)
+        datetime_keys: Subset of keys rendered with isoformat() (None stays None)
+        enum_keys: Subset of keys rendered as their enum .value (None stays None)
+
+    Returns:
+        Function taking a model instance and returning its dict projection
+    """
+    for key in keys:
+        if not key.isidentifier():
+            raise ValueError(f"Invalid attribute name: {key!r}")
+
+    entries = []
+    for key in keys:
+        if key in datetime_keys:
+            entries.append(f"{key!r}: (v.isoformat() if (v := self.{key}) else None)")
+        elif key in enum_keys:
+            entries.append(f"{key!r}: (v.value if (v := self.{key}) is not None else None)")
+        else:
+            entries.append(f"{key!r}: self.{key}")
+
+    source = "def to_dict(self):\n    return {" + ", ".join(entries) + "}\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<dict projector>", "exec"), namespace)
+
+    to_dict = namespace["to_dict"]
+    to_dict.__doc__ = "Convert to dictionary."
+    return to_dict